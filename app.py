@@ -4,7 +4,7 @@ Main Streamlit Application
 """
 
 import streamlit as st
-import os, sys
+import os, sys, json, hashlib
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from dotenv import load_dotenv
@@ -19,7 +19,7 @@ from components.pdf_parser import PDFParser
 from components.score_calculator import ScoreCalculator
 from components.keyword_analyzer import KeywordAnalyzer
 from components.section_evaluator import SectionEvaluator
-from components.ai_suggester import AISuggester
+from components.ai_suggester import ModelUnavailableError, get_suggester
 
 # ─────────────────────────────────────────────────────────
 # PAGE CONFIG
@@ -74,6 +74,45 @@ if not AWS_ACCESS_KEY:
     except Exception:
         pass
 
+# ─────────────────────────────────────────────────────────
+# AI RESPONSE CACHE
+# ─────────────────────────────────────────────────────────
+# Survives reruns and new AISuggester instances. Keyed on a hash of the
+# configured keys (which decide the provider) and the canonical context JSON;
+# the leading underscore keeps the suggester itself out of the cache key.
+# Only model output is cached: the rule-based/template fallback is raised out
+# of the cached function, so a transient failure is retried on the next call.
+_AI_KEY_HASH = hashlib.sha256(
+    f"{GEMINI_KEY}|{GROQ_KEY}|{AWS_ACCESS_KEY}".encode()).hexdigest()[:16]
+
+
+def _ctx_json(ctx: dict) -> str:
+    return json.dumps(ctx, sort_keys=True, default=str)
+
+
+@st.cache_data(ttl=1800, max_entries=256, show_spinner=False)
+def _model_suggestions(_suggester, key_hash: str, ctx_json: str) -> list:
+    return _suggester.generate_suggestions(json.loads(ctx_json), fallback=False)
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _model_section_content(_suggester, key_hash: str, section_type: str, ctx_json: str) -> str:
+    return _suggester.generate_content_for_section(section_type, json.loads(ctx_json), fallback=False)
+
+
+def cached_suggestions(suggester, key_hash: str, ctx_json: str) -> list:
+    try:
+        return _model_suggestions(suggester, key_hash, ctx_json)
+    except ModelUnavailableError as e:
+        return e.fallback
+
+
+def cached_section_content(suggester, key_hash: str, section_type: str, ctx_json: str) -> str:
+    try:
+        return _model_section_content(suggester, key_hash, section_type, ctx_json)
+    except ModelUnavailableError as e:
+        return e.fallback
+
 # ─────────────────────────────────────────────────────────
 # GLOBAL CSS
 # ─────────────────────────────────────────────────────────
@@ -495,7 +534,7 @@ if analyze_clicked:
                 for sc in section_scores.values():
                     all_improvements.extend(sc.improvement_areas)
 
-                suggester = AISuggester(
+                suggester = get_suggester(
                     api_key=GEMINI_KEY or None,
                     groq_key=GROQ_KEY or None,
                     aws_access_key=AWS_ACCESS_KEY or None,
@@ -506,7 +545,7 @@ if analyze_clicked:
                 # ── Ask Gemini for holistic ATS score (more accurate than TF-IDF alone) ──
                 ai_score = None
                 ai_eligibility = []
-                if suggester.model:
+                if suggester.has_ai:
                     try:
                         score_prompt = (
                             f"You are an ATS (Applicant Tracking System) expert.\n\n"
@@ -557,14 +596,14 @@ if analyze_clicked:
                         ai_reasoning = ''
                         ai_eligibility = []
 
-                suggestions = suggester.generate_suggestions({
+                suggestions = cached_suggestions(suggester, _AI_KEY_HASH, _ctx_json({
                     'score': metrics.normalized_score,
                     'missing_keywords': [k.term for k in ranked_kws[:10]],
                     'missing_sections': completeness.missing_sections,
                     'job_desc': job_desc,
                     'section_improvements': all_improvements,
                     'candidate_mode': mode,
-                })
+                }))
                 progress.progress(100)
                 status.empty(); progress.empty()
 
@@ -621,8 +660,7 @@ if st.session_state.analysis_done and st.session_state.results:
                      help="Jump to CV Builder — auto-fills from your resume with AI improvements"):
             # Auto-parse resume now so cv_builder opens already filled
             from components.resume_extractor import extract_resume_structure
-            from components.ai_suggester import AISuggester as _AI
-            _s = _AI(api_key=GEMINI_KEY or None, groq_key=GROQ_KEY or None)
+            _s = get_suggester(api_key=GEMINI_KEY or None, groq_key=GROQ_KEY or None)
             try:
                 from components.resume_extractor import ParsedResume
                 _parsed = extract_resume_structure(r['resume_text'], _s.model, suggester=_s)
@@ -854,16 +892,16 @@ if st.session_state.analysis_done and st.session_state.results:
                                     # Extract clean role name from JD (first non-empty short line)
                                     jd_lines = [l.strip() for l in r['job_desc'].split('\n') if l.strip()]
                                     clean_role = next((l for l in jd_lines if len(l) < 60 and not l.startswith(('#','*','-'))), jd_lines[0] if jd_lines else 'ML Engineer')
-                                    improved = suggester.generate_content_for_section(
-                                        name,
-                                        {
+                                    improved = cached_section_content(
+                                        suggester, _AI_KEY_HASH, name,
+                                        _ctx_json({
                                             'job_desc': r['job_desc'],
                                             'existing_resume': r['resume_text'],
                                             'section_content': sc.content if hasattr(sc, 'content') else '',
                                             'target_role': clean_role,
                                             'candidate_mode': st.session_state.candidate_mode,
                                             'issues': '\n'.join(sc.improvement_areas),
-                                        }
+                                        })
                                     )
                                     st.session_state.fixed_sections[fix_result_key] = improved
 
@@ -957,7 +995,7 @@ if st.session_state.analysis_done and st.session_state.results:
                 jd = r['job_desc']
                 mode_str = st.session_state.candidate_mode
 
-                if suggester.model:
+                if suggester.has_ai:
                     prompts = {
                         'summary': (
                             f"Write a professional summary for this resume targeting: {clean_role}.\n\n"
@@ -1028,10 +1066,14 @@ if st.session_state.analysis_done and st.session_state.results:
                         ),
                     }
                     prompt = prompts.get(selected, prompts['summary'])
+                    # Show tokens as they arrive; the final text is rendered below
+                    live = st.empty()
                     try:
-                        generated = suggester._call_model(prompt)
+                        with live.container():
+                            generated = st.write_stream(suggester.stream_model(prompt))
                     except Exception as e:
                         generated = f"❌ AI error: {e}"
+                    live.empty()
                 else:
                     # No AI — give a useful structured template, not raw resume dump
                     generated = suggester.generate_content_for_section(
@@ -4,10 +4,20 @@ Generates improvement recommendations using Amazon Bedrock (primary),
 Groq/Llama (secondary), or Google Gemini (tertiary).
 """
 
+import re
 import time
 import json
+import random
+import hashlib
+import functools
+import threading
+from itertools import islice
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Iterator, List, Optional
+
+from components.keyword_analyzer import TECH_TERMS_LONGEST_FIRST
 
 try:
     import boto3
@@ -17,18 +27,36 @@ except ImportError:
 
 try:
     import google.generativeai as genai
+    from google.api_core import exceptions as gexc
     GEMINI_AVAILABLE = True
 except ImportError:
     GEMINI_AVAILABLE = False
 
 try:
     from groq import Groq as GroqClient
+    from groq import APIConnectionError as GroqConnectionError, InternalServerError as GroqServerError
     GROQ_AVAILABLE = True
 except ImportError:
     GROQ_AVAILABLE = False
 
+# Provider errors worth retrying; anything else fails the same way on every attempt
+_TRANSIENT_ERRORS = (TimeoutError, ConnectionError)
+if GEMINI_AVAILABLE:
+    _TRANSIENT_ERRORS += (gexc.ResourceExhausted, gexc.DeadlineExceeded, gexc.ServiceUnavailable)
+if GROQ_AVAILABLE:
+    _TRANSIENT_ERRORS += (GroqConnectionError, GroqServerError)
+
+
+class ModelUnavailableError(Exception):
+    """Raised instead of returning rule-based or template output when the caller
+    asked for model output only (fallback=False); `fallback` holds that output."""
+
+    def __init__(self, fallback):
+        super().__init__("AI model output unavailable")
+        self.fallback = fallback
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Suggestion:
     suggestion: str
     category: str
@@ -36,7 +64,7 @@ class Suggestion:
     implementation_difficulty: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PrioritizedSuggestion:
     suggestion: str
     priority: int  # 1-5, 1 = highest
@@ -167,7 +195,339 @@ def _build_smart_suggestions(ctx: dict) -> list:
     return suggestions[:7]
 
 
-FALLBACK_SUGGESTIONS = _build_smart_suggestions({})  # empty fallback for import safety
+# Immutable so the shared instance can be handed out without defensive copies
+FALLBACK_SUGGESTIONS = tuple(_build_smart_suggestions({}))  # empty fallback for import safety
+
+
+# ── Prompt preambles ──────────────────────────────────────────────────────────
+# Static instructions go first and per-request data last, so every call shares
+# a byte-identical prefix that provider-side prompt caching can reuse.
+
+_PROMPT_SEPARATOR = "\n\n---\n"
+
+_COACH_PREAMBLE = """You are an expert ATS resume coach.
+
+Generate exactly 6 specific, actionable improvement suggestions tailored to the candidate profile and analysis results given after the --- line.
+Return ONLY a JSON array of 6 objects (no markdown, no extra text), each with these fields:
+  "suggestion": specific actionable advice
+  "priority": integer 1-5, 1 = highest
+  "category": one of keywords/experience/structure/format/language/skills
+  "impact_estimate": High/Medium/Low
+  "implementation_difficulty": Low/Medium/High
+
+Be specific, practical, and professional. Focus on ATS optimization."""
+
+# Gemini enforces this on its side; the other providers follow the preamble above
+SUGGESTION_SCHEMA = {
+    'type': 'ARRAY',
+    'items': {
+        'type': 'OBJECT',
+        'properties': {
+            'suggestion': {'type': 'STRING'},
+            'priority': {'type': 'INTEGER'},
+            'category': {'type': 'STRING'},
+            'impact_estimate': {'type': 'STRING'},
+            'implementation_difficulty': {'type': 'STRING'},
+        },
+        'required': ['suggestion', 'priority', 'category',
+                     'impact_estimate', 'implementation_difficulty'],
+    },
+}
+
+_MODE_CONTEXT = {
+    'fresher': "This is a STUDENT/FRESHER resume. Focus on academic projects, coursework, certifications, and transferable skills. Do NOT suggest adding work experience they don't have.",
+    'intern': "This is an INTERNSHIP applicant. They may have limited experience. Focus on projects, skills, and eagerness to learn.",
+    'professional': "This is an EXPERIENCED PROFESSIONAL. Focus on impact quantification, leadership, and senior-level positioning.",
+}
+
+_CONTENT_PREAMBLES = {
+    'summary': (
+        "Improve or write a professional summary for the resume given after the --- line.\n\n"
+        "Rules:\n"
+        "- Base the summary on the candidate's ACTUAL experience from their resume\n"
+        "- Reference their real projects, skills, and achievements\n"
+        "- Mention 2-3 specific skills from the job description\n"
+        "- Do NOT use cliches like 'Results-driven', 'Passionate', or 'Dynamic'\n"
+        "- Do NOT say '[Your University]' - use actual university name if visible in resume\n"
+        "- 3-4 sentences, under 80 words\n"
+        "- Return ONLY the summary text, nothing else"
+    ),
+    'skills': (
+        "You are an ATS resume expert. Improve the skills section given after the --- line for the target role.\n\n"
+        "YOUR TASK - do ALL of these:\n"
+        "1. Keep every existing skill category and item\n"
+        "2. Scan the JD and ADD missing technical skills the candidate realistically has given their projects\n"
+        "3. ADD skills that appear in the JD but not in the current skills list\n"
+        "4. If a JD skill is already present, do not add it again\n"
+        "5. Consider adding a new category if the JD emphasizes a domain not covered (e.g. 'Cloud Platforms', 'Databases')\n\n"
+        "IMPORTANT: The output MUST differ from the input - you must add at least 2-3 new items from the JD.\n"
+        "Return ONLY lines in format: Category: item1, item2, item3 (no bullets, no explanation)"
+    ),
+    'projects': (
+        "Improve the project bullets in the resume given after the --- line to better target the role.\n\n"
+        "For each project, rewrite the bullets to:\n"
+        "1. Start with strong action verbs (Developed, Built, Achieved, Deployed)\n"
+        "2. Include specific metrics (accuracy %, dataset size, latency, etc.)\n"
+        "3. Incorporate relevant JD keywords naturally\n"
+        "4. Keep the real project names and actual tech stacks from the resume\n\n"
+        "Format: ProjectName | TechStack\n"
+        "- bullet 1\n"
+        "- bullet 2\n\n"
+        "Return ONLY the improved project entries."
+    ),
+    'certifications': (
+        "Suggest 3-4 specific, real certifications for someone targeting the role given after the --- line.\n\n"
+        "For each certification:\n"
+        "• [Exact Certification Name] | [Platform] | [~Duration or cost]\n"
+        "  Why relevant: [1 sentence]\n\n"
+        "Focus on: Google, Coursera/DeepLearning.AI, AWS, Microsoft, Kaggle.\n"
+        "Only suggest real, existing certifications.\n"
+        "Return ONLY the certification list."
+    ),
+}
+
+
+# ── Suggestion cache ──────────────────────────────────────────────────────────
+# Two uploads with near-identical analyses (same JD, same score band, the same
+# keywords and section issues in a different order) would otherwise each pay
+# for a full LLM round-trip. Entries are keyed on a canonical form of the context.
+
+SUGGESTION_CACHE_SIZE = 64
+
+_suggestion_cache = {}   # canonical key → suggestions
+_suggestion_cache_lock = threading.Lock()
+
+
+# In-flight model calls keyed by prompt hash — concurrent sessions sending the
+# same prompt wait on the first caller's request instead of firing their own.
+_inflight = {}   # prompt sha1 → Future
+_inflight_lock = threading.Lock()
+
+# Recent responses under the same key, so reruns and repeated clicks with an
+# identical prompt skip the round-trip. Guarded by _inflight_lock.
+RESPONSE_CACHE_SIZE = 128
+RESPONSE_CACHE_TTL = 300   # seconds
+
+_response_cache = OrderedDict()   # prompt sha1 → (text, monotonic time stored)
+
+
+def _cached_response(key: str) -> Optional[str]:
+    """Fresh cached text for a prompt hash, else None. Caller holds _inflight_lock."""
+    hit = _response_cache.get(key)
+    if hit and time.monotonic() - hit[1] < RESPONSE_CACHE_TTL:
+        _response_cache.move_to_end(key)
+        return hit[0]
+    return None
+
+
+def _store_response(key: str, text: str) -> None:
+    with _inflight_lock:
+        _response_cache[key] = (text, time.monotonic())
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+def _discard_response(prompt: str) -> None:
+    """Drop a cached response that turned out unusable, so a retry asks the model again."""
+    with _inflight_lock:
+        _response_cache.pop(hashlib.sha1(prompt.encode()).hexdigest(), None)
+
+
+def _suggestion_cache_key(ctx: dict) -> tuple:
+    """Score band, JD and mode plus order-insensitive section issues and keywords."""
+    kws = frozenset(k.lower().strip() for k in ctx.get('missing_keywords', [])[:10])
+    jd_hash = hashlib.md5(ctx.get('job_desc', '')[:500].encode()).hexdigest()[:8]
+    score = ctx.get('score', 50)
+    return (score // 10 if isinstance(score, (int, float)) else score,
+            jd_hash,
+            ctx.get('candidate_mode', ''),
+            tuple(sorted(ctx.get('missing_sections', []))),
+            tuple(sorted(islice(ctx.get('section_improvements') or (), 8))),
+            tuple(sorted(kws)))
+
+
+def _cache_lookup(ctx: dict) -> Optional[List['PrioritizedSuggestion']]:
+    """Suggestions stored for an equivalent context, else None."""
+    with _suggestion_cache_lock:
+        hit = _suggestion_cache.get(_suggestion_cache_key(ctx))
+    return list(hit) if hit else None
+
+
+def _cache_store(ctx: dict, suggestions: List['PrioritizedSuggestion']) -> None:
+    key = _suggestion_cache_key(ctx)
+    with _suggestion_cache_lock:
+        if key not in _suggestion_cache and len(_suggestion_cache) >= SUGGESTION_CACHE_SIZE:
+            _suggestion_cache.pop(next(iter(_suggestion_cache)))   # evict oldest
+        _suggestion_cache[key] = list(suggestions)
+
+
+# ── Template extraction patterns ─────────────────────────────────────────────
+
+_RE_CONTACT_CHARS = re.compile(r'[@\d•-]')
+_RE_DEGREE_PARENS = re.compile(r'\(([^)]+)\)')
+# Matched against already-lowercased lines; re.I alternations are several times slower
+_RE_UNI_KW        = re.compile(r'university|institute|college|iit|nit|bits|jss|vit|srm|manipal')
+_RE_DEGREE_KW     = re.compile(r'b\.tech|bachelor|m\.tech|master|b\.sc')
+_RE_SKILLS_HDR    = re.compile(r'^SKILLS?\s*$', re.I)
+_RE_SKILLS_END    = re.compile(r'^(EDUCATION|EXPERIENCE|PROJECTS?|CERT|AWARD|SUMM|PROFILE|CONTACT)', re.I)
+_RE_PROJECTS_HDR  = re.compile(r'^PROJECTS?\s*$', re.I)
+_RE_PROJECTS_END  = re.compile(r'^(SKILLS?|EDUCATION|CERT|AWARD|SUMM|PROFILE|CONTACT|EXPERIENCE)', re.I)
+_RE_CAT_LINE      = re.compile(r'^([^:]{2,50}):\s*(.+)$')
+
+_CONTACT_SKIP = frozenset({'email', 'phone', 'linkedin', 'github', 'address', 'location', 'website'})
+_SKILL_CATEGORY_WORDS = frozenset({
+    'programming', 'language', 'languages', 'ai', 'ml', 'data', 'science', 'libraries',
+    'tools', 'developer', 'frameworks', 'technical', 'skills', 'software', 'cloud',
+})
+# JD terms that may be appended to a resume's language / library skill lines
+_JD_LANGUAGES = frozenset({'python', 'java', 'c++', 'r', 'scala', 'golang'})
+_JD_LIBRARIES = frozenset({
+    'tensorflow', 'pytorch', 'keras', 'numpy', 'pandas', 'scikit-learn',
+    'streamlit', 'fastapi', 'matplotlib', 'xgboost', 'lightgbm',
+})
+
+
+# 2.5 models apply implicit prefix caching, which the static-first prompt
+# layout is built for; older models are only used when 2.5 is unavailable.
+_GEMINI_DEFAULT = 'gemini-2.5-flash'
+_GEMINI_PREFERRED = (
+    'models/gemini-2.5-flash', 'models/gemini-2.5-flash-lite',
+    'models/gemini-1.5-flash', 'models/gemini-1.5-flash-latest',
+    'models/gemini-1.5-flash-8b', 'models/gemini-2.0-flash-lite',
+    'models/gemini-2.0-flash', 'models/gemini-1.5-pro-latest',
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_gemini_model(key_hash: str) -> str:
+    """Pick the first preferred Gemini model the configured key can use.
+
+    list_models() is a network round-trip, so the answer is cached per key
+    (by hash, so the key itself never becomes a cache argument). genai must
+    already be configured with the matching key. Errors propagate and are
+    not cached, so a transient failure is retried on the next construction.
+    """
+    available = {m.name for m in genai.list_models()
+                 if 'generateContent' in m.supported_generation_methods}
+    for pref in _GEMINI_PREFERRED:
+        if pref in available:
+            return pref.replace('models/', '')
+    return _GEMINI_DEFAULT
+
+
+# One GenerativeModel per API key (by hash) for the whole process, so new
+# AISuggester instances skip re-configuring genai and rebuilding the client.
+_gemini_models = {}   # key hash → GenerativeModel
+_gemini_configured = None   # hash of the key genai is currently configured with
+_gemini_models_lock = threading.Lock()
+
+
+def _gemini_model_for(api_key: str):
+    global _gemini_configured
+    key_hash = hashlib.sha1(api_key.encode()).hexdigest()[:8]
+    with _gemini_models_lock:
+        model = _gemini_models.get(key_hash)
+        if model is None:
+            if _gemini_configured != key_hash:
+                genai.configure(api_key=api_key)
+                _gemini_configured = key_hash
+            try:
+                model_name = _resolve_gemini_model(key_hash)
+            except Exception:
+                model_name = _GEMINI_DEFAULT
+            model = _gemini_models[key_hash] = genai.GenerativeModel(model_name)
+        return model
+
+
+_RE_TOKEN = re.compile(r'\w+|[^\w\s]')
+
+
+def _fall_back(result, allowed: bool):
+    """Return rule-based/template output, or raise it if the caller wants model output only."""
+    if not allowed:
+        raise ModelUnavailableError(result)
+    return result
+
+
+def _is_transient(e: Exception) -> bool:
+    """True for timeouts, overload and quota errors, including ones re-raised with `from`."""
+    return isinstance(e, _TRANSIENT_ERRORS) or isinstance(e.__cause__, _TRANSIENT_ERRORS)
+
+
+def _truncate_to_tokens(text: str, budget: int) -> str:
+    """Keep the longest prefix of text that fits in roughly `budget` model tokens.
+
+    Tokens are approximated locally as words and punctuation marks (close to
+    BPE counts for English), so dense and sparse text get the same token
+    budget instead of the same character budget. Cuts never split a word.
+    """
+    for i, m in enumerate(_RE_TOKEN.finditer(text)):
+        if i == budget:
+            return text[:m.start()].rstrip()
+    return text
+
+
+def _scan_tech_terms(text_lower: str, limit: int) -> list:
+    """Return up to `limit` tech terms (4+ chars) found in lowercased text, longest first."""
+    found = []
+    for term in TECH_TERMS_LONGEST_FIRST:
+        if len(term) > 3 and term in text_lower:
+            found.append(term.title() if len(term.split()) == 1 else term)
+            if len(found) >= limit:
+                break
+    return found
+
+
+class RateLimiter:
+    """Spaces calls at least 60/rpm seconds apart across threads.
+
+    Waiting a little before each call keeps a burst under the provider quota,
+    which is cheaper than eating a 429 and the retry backoff after it.
+    """
+
+    def __init__(self, rpm: float):
+        self.interval = 60.0 / rpm
+        self.next = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next - now
+            self.next = max(now, self.next) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Free-tier Gemini allows 15 requests/minute per project; stay just under it
+GEMINI_RPM = 14
+_gemini_limiter = RateLimiter(GEMINI_RPM)
+
+
+# One AISuggester per credential set for the whole process, keyed by a hash of
+# the credentials so the secrets themselves are never kept as cache keys.
+SUGGESTER_CACHE_SIZE = 4
+
+_suggesters = {}   # credentials sha256 → AISuggester
+_suggesters_lock = threading.Lock()
+
+
+def get_suggester(api_key: Optional[str] = None, groq_key: Optional[str] = None,
+                  aws_access_key: Optional[str] = None, aws_secret_key: Optional[str] = None,
+                  aws_region: str = 'us-east-1') -> 'AISuggester':
+    """Shared AISuggester per credential set, so reruns reuse the provider clients."""
+    creds = '\0'.join(str(v) for v in (api_key, groq_key, aws_access_key, aws_secret_key, aws_region))
+    key = hashlib.sha256(creds.encode()).hexdigest()
+    with _suggesters_lock:
+        suggester = _suggesters.get(key)
+        if suggester is None:
+            if len(_suggesters) >= SUGGESTER_CACHE_SIZE:
+                _suggesters.pop(next(iter(_suggesters)))   # evict oldest
+            suggester = _suggesters[key] = AISuggester(
+                api_key=api_key, groq_key=groq_key, aws_access_key=aws_access_key,
+                aws_secret_key=aws_secret_key, aws_region=aws_region)
+        return suggester
 
 
 class AISuggester:
@@ -177,13 +537,22 @@ class AISuggester:
 
     MAX_RETRIES = 3
     RETRY_DELAY = 2
+    MAX_BACKOFF = 60
+    BEDROCK_COOLDOWN = 600   # seconds Bedrock is skipped after an access error
+
+    BEDROCK_MODEL_ID = 'us.anthropic.claude-haiku-4-5-20251001-v1:0'
+    GROQ_MODEL = "llama-3.3-70b-versatile"
 
     def __init__(self, api_key: Optional[str] = None, groq_key: Optional[str] = None,
                  aws_access_key: Optional[str] = None, aws_secret_key: Optional[str] = None,
                  aws_region: str = 'us-east-1'):
-        self.model   = None   # Gemini
+        self._model  = None   # Gemini, created on first use (see `model`)
+        self._gemini_key = api_key if GEMINI_AVAILABLE else None
+        self._model_lock = threading.Lock()
         self.groq    = None   # Groq
         self.bedrock = None   # Bedrock (primary)
+        self._bedrock_paused_until = 0.0
+        self._bedrock_lock = threading.Lock()
 
         # PRIMARY: Bedrock
         if aws_access_key and aws_secret_key and BEDROCK_AVAILABLE:
@@ -206,29 +575,41 @@ class AISuggester:
             except Exception:
                 self.groq = None
 
-        # TERTIARY: Gemini
-        if api_key and GEMINI_AVAILABLE:
-            try:
-                genai.configure(api_key=api_key)
-                model_name = 'gemini-1.5-flash'
-                try:
-                    available = [m.name for m in genai.list_models()
-                                 if 'generateContent' in m.supported_generation_methods]
-                    preferred = [
-                        'models/gemini-1.5-flash', 'models/gemini-1.5-flash-latest',
-                        'models/gemini-1.5-flash-8b', 'models/gemini-2.0-flash-lite',
-                        'models/gemini-2.0-flash', 'models/gemini-1.5-pro-latest',
-                    ]
-                    for pref in preferred:
-                        if pref in available:
-                            model_name = pref.replace('models/', '')
-                            break
-                except Exception:
-                    pass
-                self.model = genai.GenerativeModel(model_name)
-                print("[ATS] AI: Gemini connected ✓")
-            except Exception:
-                self.model = None
+    @property
+    def model(self):
+        """TERTIARY: Gemini. Configured on first access, so sessions that never reach it skip model discovery."""
+        if self._gemini_key:
+            with self._model_lock:
+                if self._gemini_key:
+                    api_key, self._gemini_key = self._gemini_key, None
+                    try:
+                        self._model = _gemini_model_for(api_key)
+                        print("[ATS] AI: Gemini connected ✓")
+                    except Exception:
+                        self._model = None
+        return self._model
+
+    @model.setter
+    def model(self, value):
+        self._gemini_key = None
+        self._model = value
+
+    def _bedrock_ready(self) -> bool:
+        """Bedrock is configured and not paused by an access error."""
+        if self.bedrock is None:
+            return False
+        with self._bedrock_lock:
+            return time.monotonic() >= self._bedrock_paused_until
+
+    def _pause_bedrock(self) -> None:
+        """Skip Bedrock for BEDROCK_COOLDOWN seconds.
+
+        The suggester is shared by every session (see get_suggester), so an
+        access error pauses Bedrock for a while instead of disabling it for good.
+        """
+        with self._bedrock_lock:
+            self._bedrock_paused_until = time.monotonic() + self.BEDROCK_COOLDOWN
+        print(f"[ATS] Bedrock paused for {self.BEDROCK_COOLDOWN}s")
 
     @property
     def has_ai(self) -> bool:
@@ -238,7 +619,7 @@ class AISuggester:
         """Call Amazon Bedrock — Claude 3.5 Haiku."""
         import json as _json
         response = self.bedrock.converse(
-            modelId='us.anthropic.claude-haiku-4-5-20251001-v1:0',
+            modelId=self.BEDROCK_MODEL_ID,
             messages=[{'role': 'user', 'content': [{'text': prompt}]}],
             inferenceConfig={'maxTokens': 1024, 'temperature': 0.7}
         )
@@ -247,27 +628,169 @@ class AISuggester:
     def _call_groq(self, prompt: str) -> str:
         """Call Groq — Llama 3.3 70B."""
         resp = self.groq.chat.completions.create(
-            model="llama-3.3-70b-versatile",
+            model=self.GROQ_MODEL,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=1024, temperature=0.7,
         )
         return resp.choices[0].message.content.strip()
 
-    def _call_model(self, prompt: str, max_retries: int = 1) -> str:
-        """Call AI: Bedrock → Groq → Gemini."""
+    def _stream_bedrock(self, prompt: str) -> Iterator[str]:
+        response = self.bedrock.converse_stream(
+            modelId=self.BEDROCK_MODEL_ID,
+            messages=[{'role': 'user', 'content': [{'text': prompt}]}],
+            inferenceConfig={'maxTokens': 1024, 'temperature': 0.7}
+        )
+        for event in response['stream']:
+            text = event.get('contentBlockDelta', {}).get('delta', {}).get('text')
+            if text:
+                yield text
+
+    def _stream_groq(self, prompt: str) -> Iterator[str]:
+        stream = self.groq.chat.completions.create(
+            model=self.GROQ_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=1024, temperature=0.7, stream=True,
+        )
+        for chunk in stream:
+            text = chunk.choices[0].delta.content if chunk.choices else None
+            if text:
+                yield text
+
+    def _stream_gemini(self, prompt: str, max_retries: int = 1) -> Iterator[str]:
+        for attempt in range(max_retries + 1):
+            _gemini_limiter.acquire()
+            started = False
+            try:
+                for chunk in self.model.generate_content(prompt, stream=True):
+                    if chunk.text:
+                        started = True
+                        yield chunk.text
+                return
+            except Exception as e:
+                err_str = str(e)
+                is_quota = '429' in err_str or 'quota' in err_str.lower()
+                # Only retry before any text is out; a restart would repeat it
+                if started or not is_quota or attempt >= max_retries:
+                    raise
+                time.sleep(self._backoff(attempt, base=8))
+
+    def _stream_providers(self, prompt: str) -> Iterator[str]:
+        """Stream from the first provider that starts answering: Bedrock → Groq → Gemini.
+
+        A provider failing before its first chunk falls through to the next one;
+        a failure mid-answer propagates, since text has already been shown.
+        Readiness is checked only when a provider is reached, so Gemini is not
+        configured while Bedrock or Groq is answering.
+        """
+        sources = ((self._stream_bedrock, self._bedrock_ready),
+                   (self._stream_groq, lambda: self.groq is not None),
+                   (self._stream_gemini, lambda: self.model is not None))
+        error = None
+        for source, ready in sources:
+            if not ready():
+                continue
+            started = False
+            try:
+                for chunk in source(prompt):
+                    started = True
+                    yield chunk
+                return
+            except Exception as e:
+                if started:
+                    raise
+                print(f"[ATS] {source.__name__[8:].title()} stream failed ({str(e)[:80]})")
+                error = e
+        if error is not None:
+            raise error
+        raise Exception("No AI available. Add AWS credentials or GROQ_API_KEY to .env.")
+
+    def stream_model(self, prompt: str) -> Iterator[str]:
+        """Like _call_model, but yields text as it arrives (e.g. for st.write_stream).
+
+        A cached response, or the result of a request already in flight for
+        the same prompt, is yielded whole; a completed stream is cached.
+        """
+        key = hashlib.sha1(prompt.encode()).hexdigest()
+        with _inflight_lock:
+            cached = _cached_response(key)
+            fut = _inflight.get(key) if cached is None else None
+            is_leader = cached is None and fut is None
+            if is_leader:
+                fut = _inflight[key] = Future()
+        if cached is not None:
+            yield cached
+            return
+        if not is_leader:
+            yield fut.result()
+            return
+
+        parts = []
+        try:
+            for chunk in self._stream_providers(prompt):
+                parts.append(chunk)
+                yield chunk
+        except BaseException as e:
+            # Also covers the consumer closing the generator, so followers never hang
+            fut.set_exception(e if isinstance(e, Exception) else
+                              RuntimeError("Stream closed before the response completed"))
+            raise
+        else:
+            result = ''.join(parts).strip()
+            fut.set_result(result)
+            _store_response(key, result)
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+
+    def _backoff(self, attempt: int, base: float = None) -> float:
+        """Exponential backoff with jitter, so concurrent sessions don't retry in lockstep."""
+        base = self.RETRY_DELAY if base is None else base
+        return min(self.MAX_BACKOFF, base * 2 ** attempt + random.uniform(0, base))
+
+    def _call_model(self, prompt: str, max_retries: int = 1,
+                    response_schema: Optional[dict] = None) -> str:
+        """Call AI, reusing a recent response or an in-flight request for the same prompt."""
+        key = hashlib.sha1(prompt.encode()).hexdigest()
+        with _inflight_lock:
+            cached = _cached_response(key)
+            if cached is not None:
+                return cached
+            fut = _inflight.get(key)
+            is_leader = fut is None
+            if is_leader:
+                fut = _inflight[key] = Future()
+        if not is_leader:
+            return fut.result()
+
+        try:
+            result = self._call_providers(prompt, max_retries, response_schema)
+        except Exception as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(result)
+            _store_response(key, result)
+            return result
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+
+    def _call_providers(self, prompt: str, max_retries: int = 1,
+                        response_schema: Optional[dict] = None) -> str:
+        """Call AI: Bedrock → Groq → Gemini. Gemini output is constrained to response_schema if given."""
 
         # PRIMARY: Bedrock
-        if self.bedrock:
+        if self._bedrock_ready():
             try:
                 return self._call_bedrock(prompt)
             except Exception as e:
                 err = str(e)
                 # Fall through on ANY Bedrock error — don't block the user
                 print(f"[ATS] Bedrock unavailable ({err[:80]}), trying Groq...")
-                # If it's a use-case/access issue, disable bedrock for this session
+                # A use-case/access issue won't clear on retry, so stop asking for a while
                 if any(x in err for x in ['ResourceNotFoundException', 'AccessDenied',
                                            'use case', 'not submitted']):
-                    self.bedrock = None  # stop retrying this session
+                    self._pause_bedrock()
 
         # SECONDARY: Groq
         if self.groq:
@@ -278,172 +801,195 @@ class AISuggester:
                 if '429' in err or 'rate' in err.lower():
                     print(f"[ATS] Groq rate limited, trying Gemini...")
                 else:
-                    raise Exception(f"Groq error: {err[:150]}")
+                    raise Exception(f"Groq error: {err[:150]}") from e
 
         # TERTIARY: Gemini
         if self.model:
+            generation_config = None
+            if response_schema is not None:
+                generation_config = {'response_mime_type': 'application/json',
+                                     'response_schema': response_schema}
             for attempt in range(max_retries + 1):
                 try:
-                    resp = self.model.generate_content(prompt)
-                    return resp.text.strip()
+                    _gemini_limiter.acquire()
+                    # Read as a stream and joined once the last chunk arrives
+                    resp = self.model.generate_content(prompt, generation_config=generation_config,
+                                                       stream=True)
+                    text = ''.join(chunk.text for chunk in resp if chunk.text)
+                    cached = getattr(getattr(resp, 'usage_metadata', None), 'cached_content_token_count', 0)
+                    if cached:
+                        print(f"[ATS] Gemini prompt cache hit: {cached} tokens")
+                    return text.strip()
                 except Exception as e:
                     err_str = str(e)
                     is_quota = '429' in err_str or 'quota' in err_str.lower()
                     if is_quota and attempt < max_retries:
-                        time.sleep(8)
+                        time.sleep(self._backoff(attempt, base=8))
                         continue
                     raise
 
         raise Exception("No AI available. Add AWS credentials or GROQ_API_KEY to .env.")
 
-    def generate_suggestions(self, analysis_context: dict) -> List[PrioritizedSuggestion]:
-        """Generate improvement suggestions based on analysis results."""
+    def generate_suggestions(self, analysis_context: dict,
+                             fallback: bool = True) -> List[PrioritizedSuggestion]:
+        """Generate improvement suggestions based on analysis results.
+
+        With fallback=False, rule-based suggestions are raised as
+        ModelUnavailableError instead of returned, so callers can avoid caching them.
+        """
         if not self.has_ai:
-            return _build_smart_suggestions(analysis_context)
+            return _fall_back(_build_smart_suggestions(analysis_context), fallback)
+
+        cached = _cache_lookup(analysis_context)
+        if cached:
+            return cached
 
         prompt = self._build_prompt(analysis_context)
 
         for attempt in range(self.MAX_RETRIES):
             try:
-                raw = self._call_model(prompt)
+                raw = self._call_model(prompt, response_schema=SUGGESTION_SCHEMA)
                 suggestions = self._parse_suggestions(raw)
-                if suggestions:
-                    return suggestions
+            except ValueError:
+                suggestions = []  # malformed output — a fresh generation may parse
             except Exception as e:
-                if attempt < self.MAX_RETRIES - 1:
-                    time.sleep(self.RETRY_DELAY * (attempt + 1))
+                if not _is_transient(e):
+                    print(f"[ATS] Suggestions failed ({str(e)[:80]}), using rule-based fallback")
+                    break
+                suggestions = []
+            if suggestions:
+                _cache_store(analysis_context, suggestions)
+                return suggestions
+            _discard_response(prompt)
+            if attempt < self.MAX_RETRIES - 1:
+                time.sleep(self._backoff(attempt))
+
+        return _fall_back(_build_smart_suggestions(analysis_context), fallback)
+
+    def _parse_suggestions(self, raw: str) -> List[PrioritizedSuggestion]:
+        """Parse the JSON suggestion array; raises ValueError if the response holds none."""
+        start, end = raw.find('['), raw.rfind(']')
+        if start == -1 or end < start:
+            raise ValueError("No JSON array in model response")
+        suggestions = []
+        for d in json.loads(raw[start:end + 1]):
+            if not isinstance(d, dict) or not str(d.get('suggestion', '')).strip():
                 continue
+            try:
+                priority = min(5, max(1, int(d.get('priority', 3))))
+            except (TypeError, ValueError):
+                priority = 3
+            suggestions.append(PrioritizedSuggestion(
+                suggestion=str(d['suggestion']).strip(),
+                priority=priority,
+                category=str(d.get('category') or 'general').strip().lower(),
+                impact_estimate=str(d.get('impact_estimate') or 'Medium').strip(),
+                implementation_difficulty=str(d.get('implementation_difficulty') or 'Medium').strip(),
+            ))
+        return sorted(suggestions, key=lambda s: s.priority)
 
-        return _build_smart_suggestions(analysis_context)
+    def generate_content_for_section(self, section_type: str, context: dict,
+                                     fallback: bool = True) -> str:
+        """Generate content for a missing resume section.
 
-    def generate_content_for_section(self, section_type: str, context: dict) -> str:
-        """Generate content for a missing resume section."""
-        if not self.model:
-            return self._get_template(section_type, context)
+        With fallback=False, the template is raised as ModelUnavailableError.
+        """
+        if not self.has_ai:
+            return _fall_back(self._get_template(section_type, context), fallback)
 
         prompt = self._build_content_prompt(section_type, context)
 
         for attempt in range(self.MAX_RETRIES):
             try:
                 return self._call_model(prompt)
-            except Exception:
+            except Exception as e:
+                if not _is_transient(e):
+                    print(f"[ATS] Section generation failed ({str(e)[:80]}), using template")
+                    break
                 if attempt < self.MAX_RETRIES - 1:
-                    time.sleep(self.RETRY_DELAY)
-                continue
+                    time.sleep(self._backoff(attempt))
+
+        return _fall_back(self._get_template(section_type, context), fallback)
 
-        return self._get_template(section_type, context)
+    def generate_content_for_section_stream(self, section_type: str, context: dict) -> Iterator[str]:
+        """Streaming generate_content_for_section; yields the template if AI can't start."""
+        if not self.has_ai:
+            yield self._get_template(section_type, context)
+            return
+        started = False
+        try:
+            for chunk in self.stream_model(self._build_content_prompt(section_type, context)):
+                started = True
+                yield chunk
+        except Exception as e:
+            if started:
+                raise
+            print(f"[ATS] Section stream failed ({str(e)[:80]}), using template")
+            yield self._get_template(section_type, context)
 
     def _build_prompt(self, ctx: dict) -> str:
         score = ctx.get('score', 'N/A')
-        missing_kws = ctx.get('missing_keywords', [])[:10]
-        missing_sections = ctx.get('missing_sections', [])
-        job_desc_snippet = ctx.get('job_desc', '')[:500]
-        section_issues = ctx.get('section_improvements', [])
+        job_desc_snippet = _truncate_to_tokens(ctx.get('job_desc', ''), 125)
         mode = ctx.get('candidate_mode', 'Student / Fresher')
 
-        kw_list = ', '.join(missing_kws) if missing_kws else 'None identified'
-        sec_list = ', '.join(missing_sections) if missing_sections else 'None'
-        issues_list = '\n'.join(f'- {i}' for i in section_issues[:8]) if section_issues else 'None'
+        kw_list = ', '.join(islice(ctx.get('missing_keywords') or (), 10)) or 'None identified'
+        sec_list = ', '.join(ctx.get('missing_sections') or ()) or 'None'
+        issues_list = '\n'.join(f'- {i}' for i in islice(ctx.get('section_improvements') or (), 8)) or 'None'
 
-        mode_context = ""
         if "Fresher" in mode or "Student" in mode:
-            mode_context = "This is a STUDENT/FRESHER resume. Focus on academic projects, coursework, certifications, and transferable skills. Do NOT suggest adding work experience they don't have."
+            mode_context = _MODE_CONTEXT['fresher']
         elif "Internship" in mode:
-            mode_context = "This is an INTERNSHIP applicant. They may have limited experience. Focus on projects, skills, and eagerness to learn."
+            mode_context = _MODE_CONTEXT['intern']
         else:
-            mode_context = "This is an EXPERIENCED PROFESSIONAL. Focus on impact quantification, leadership, and senior-level positioning."
-
-        return f"""You are an expert ATS resume coach. {mode_context}
-
-ANALYSIS RESULTS:
-- ATS Compatibility Score: {score}/100
-- Missing Keywords: {kw_list}
-- Missing Resume Sections: {sec_list}
-- Specific Section Issues:
-{issues_list}
-
-Job Description (excerpt):
-{job_desc_snippet}
+            mode_context = _MODE_CONTEXT['professional']
 
-Generate exactly 6 specific, actionable improvement suggestions tailored to this candidate's profile.
-Format each suggestion EXACTLY like this (no extra text):
-
-SUGGESTION 1:
-Text: [specific actionable advice]
-Category: [keywords/experience/structure/format/language/skills]
-Impact: [High/Medium/Low]
-Difficulty: [Low/Medium/High]
-
-SUGGESTION 2:
-...and so on up to SUGGESTION 6.
-
-Be specific, practical, and professional. Focus on ATS optimization."""
+        return (
+            _COACH_PREAMBLE + _PROMPT_SEPARATOR + mode_context + "\n\n"
+            "ANALYSIS RESULTS:\n"
+            f"- ATS Compatibility Score: {score}/100\n"
+            f"- Missing Keywords: {kw_list}\n"
+            f"- Missing Resume Sections: {sec_list}\n"
+            "- Specific Section Issues:\n"
+            f"{issues_list}\n\n"
+            "Job Description (excerpt):\n"
+            f"{job_desc_snippet}"
+        )
 
     def _build_content_prompt(self, section_type: str, ctx: dict) -> str:
-        job_desc = ctx.get('job_desc', '')[:1200]
-        existing = ctx.get('existing_resume', '')[:2000]  # Use much more resume context
+        job_desc = ctx.get('job_desc', '')
+        existing = ctx.get('existing_resume', '')
         role = ctx.get('target_role', 'the target role')
         mode = ctx.get('candidate_mode', 'Student / Fresher')
         is_fresher = 'Fresher' in mode or 'Student' in mode or 'Internship' in mode
         ctype = 'Student/Fresher' if is_fresher else 'Experienced Professional'
 
-        prompts = {
+        trailers = {
             'summary': (
-                f"Improve or write a professional summary for this {ctype} resume.\n\n"
-                f"CURRENT RESUME CONTENT (use this as the basis):\n{existing[:1500]}\n\n"
-                f"TARGET ROLE: {role}\n"
-                f"JOB DESCRIPTION KEYWORDS: {job_desc[:500]}\n\n"
-                f"Rules:\n"
-                f"- Base the summary on the candidate's ACTUAL experience from their resume\n"
-                f"- Reference their real projects, skills, and achievements\n"
-                f"- Mention 2-3 specific skills from the job description\n"
-                f"- Do NOT use cliches like 'Results-driven', 'Passionate', or 'Dynamic'\n"
-                f"- Do NOT say '[Your University]' - use actual university name if visible in resume\n"
-                f"- 3-4 sentences, under 80 words\n"
-                f"- Return ONLY the summary text, nothing else"
+                f"CANDIDATE TYPE: {ctype}\n"
+                f"TARGET ROLE: {role}\n\n"
+                f"CURRENT RESUME CONTENT (use this as the basis):\n{_truncate_to_tokens(existing, 375)}\n\n"
+                f"JOB DESCRIPTION KEYWORDS: {_truncate_to_tokens(job_desc, 125)}"
             ),
             'skills': (
-                f"You are an ATS resume expert. Improve this skills section for role: {role}.\n\n"
-                f"CURRENT SKILLS (keep these, they are correct):\n{existing[:800]}\n\n"
-                f"JOB DESCRIPTION TO MATCH:\n{job_desc[:800]}\n\n"
-                f"YOUR TASK - do ALL of these:\n"
-                f"1. Keep every existing skill category and item\n"
-                f"2. Scan the JD and ADD missing technical skills the candidate realistically has given their projects\n"
-                f"3. ADD skills that appear in the JD but not in the current skills list\n"
-                f"4. If a JD skill is already present, do not add it again\n"
-                f"5. Consider adding a new category if the JD emphasizes a domain not covered (e.g. 'Cloud Platforms', 'Databases')\n\n"
-                f"IMPORTANT: The output MUST differ from the input - you must add at least 2-3 new items from the JD.\n"
-                f"Return ONLY lines in format: Category: item1, item2, item3 (no bullets, no explanation)"
+                f"TARGET ROLE: {role}\n\n"
+                f"CURRENT SKILLS (keep these, they are correct):\n{_truncate_to_tokens(existing, 200)}\n\n"
+                f"JOB DESCRIPTION TO MATCH:\n{_truncate_to_tokens(job_desc, 200)}"
             ),
             'projects': (
-                f"Improve the project bullets in this resume to better target: {role}\n\n"
-                f"CURRENT RESUME PROJECTS (improve these, keep the actual project names and tech):\n{existing[:2000]}\n\n"
-                f"JOB DESCRIPTION KEYWORDS TO INCORPORATE:\n{job_desc[:500]}\n\n"
-                f"For each project, rewrite the bullets to:\n"
-                f"1. Start with strong action verbs (Developed, Built, Achieved, Deployed)\n"
-                f"2. Include specific metrics (accuracy %, dataset size, latency, etc.)\n"
-                f"3. Incorporate relevant JD keywords naturally\n"
-                f"4. Keep the real project names and actual tech stacks from the resume\n\n"
-                f"Format: ProjectName | TechStack\n"
-                f"- bullet 1\n"
-                f"- bullet 2\n\n"
-                f"Return ONLY the improved project entries."
+                f"TARGET ROLE: {role}\n\n"
+                f"CURRENT RESUME PROJECTS (improve these, keep the actual project names and tech):\n{_truncate_to_tokens(existing, 500)}\n\n"
+                f"JOB DESCRIPTION KEYWORDS TO INCORPORATE:\n{_truncate_to_tokens(job_desc, 125)}"
             ),
             'certifications': (
-                f"Suggest 3-4 specific, real certifications for someone targeting: {role}\n"
-                f"Job description: {job_desc[:300]}\n\n"
-                f"For each certification:\n"
-                f"• [Exact Certification Name] | [Platform] | [~Duration or cost]\n"
-                f"  Why relevant: [1 sentence]\n\n"
-                f"Focus on: Google, Coursera/DeepLearning.AI, AWS, Microsoft, Kaggle.\n"
-                f"Only suggest real, existing certifications.\n"
-                f"Return ONLY the certification list."
+                f"TARGET ROLE: {role}\n"
+                f"Job description: {_truncate_to_tokens(job_desc, 75)}"
             ),
         }
-        return prompts.get(
-            section_type,
+        if section_type in trailers:
+            return _CONTENT_PREAMBLES[section_type] + _PROMPT_SEPARATOR + trailers[section_type]
+        return (
             f"Write a professional {section_type} resume section for a {ctype} targeting {role}.\n"
-            f"Job description context: {job_desc[:400]}\n"
+            f"Job description context: {_truncate_to_tokens(job_desc, 100)}\n"
             f"Return ONLY the section content, no labels or explanation."
         )
 
@@ -461,37 +1007,27 @@ Be specific, practical, and professional. Focus on ATS optimization."""
         section_type = normalized
 
         # Extract real tech keywords from JD for use in templates
-        jd_techs = []
-        from components.keyword_analyzer import TECH_TERMS
         jd_lower = job_desc.lower()
-        for term in sorted(TECH_TERMS, key=len, reverse=True):
-            if term in jd_lower and len(term) > 3:
-                jd_techs.append(term.title() if len(term.split()) == 1 else term)
-            if len(jd_techs) >= 8:
-                break
+        jd_techs = _scan_tech_terms(jd_lower, 8)
         jd_tech_str = ', '.join(jd_techs[:5]) if jd_techs else 'relevant technologies'
 
         # Extract existing skills from resume
-        existing_skills = []
-        for term in sorted(TECH_TERMS, key=len, reverse=True):
-            if term in existing.lower() and len(term) > 3:
-                existing_skills.append(term.title() if len(term.split()) == 1 else term)
-            if len(existing_skills) >= 12:
-                break
+        existing_lower = existing.lower()
+        existing_skills = _scan_tech_terms(existing_lower, 12)
 
         if normalized == 'summary':
             # Extract actual university and degree from resume
-            import re as _re
             uni_name = ''
             degree_area = 'AI/ML'
-            for line in existing.split('\n'):
-                l = line.strip()
-                if any(kw in l.lower() for kw in ['university','institute','college','iit','nit','bits','jss','vit','srm','manipal']):
+            lines = existing.split('\n')
+            for i, l_lower in enumerate(existing_lower.split('\n')):
+                if _RE_UNI_KW.search(l_lower):
                     # Could be degree line or institution line
-                    if len(l) < 60 and not _re.search(r'[@\d•-]', l):
+                    l = lines[i].strip()
+                    if len(l) < 60 and not _RE_CONTACT_CHARS.search(l):
                         uni_name = l
-                if any(kw in l.lower() for kw in ['b.tech','bachelor','m.tech','master','b.sc']):
-                    dm = _re.search(r'\(([^)]+)\)', l)
+                if _RE_DEGREE_KW.search(l_lower):
+                    dm = _RE_DEGREE_PARENS.search(lines[i])
                     if dm:
                         degree_area = dm.group(1)
 
@@ -503,9 +1039,9 @@ Be specific, practical, and professional. Focus on ATS optimization."""
 
             if is_fresher:
                 # Build from actual resume content
-                proj_count = existing.lower().count('- developed') + existing.lower().count('- built') + existing.lower().count('- engineered')
+                proj_count = existing_lower.count('- developed') + existing_lower.count('- built') + existing_lower.count('- engineered')
                 award_line = ''
-                if '1st' in existing.lower() or 'runner' in existing.lower() or 'winner' in existing.lower():
+                if '1st' in existing_lower or 'runner' in existing_lower or 'winner' in existing_lower:
                     award_line = ' Award-winning hackathon participant.'
                 return (
                     f"B.Tech {degree_area} student at {uni_display} with hands-on experience building "
@@ -520,50 +1056,49 @@ Be specific, practical, and professional. Focus on ATS optimization."""
             )
 
         elif normalized == 'skills':
-            import re as _re
             # Only match lines that look like skill categories (not email/phone/contact)
-            CONTACT_SKIP = {'email', 'phone', 'linkedin', 'github', 'address', 'location', 'website'}
             skill_lines = []
             in_skills = False
+            jd_langs = [(t, t.lower()) for t in jd_techs if t.lower() in _JD_LANGUAGES]
+            jd_libs = [(t, t.lower()) for t in jd_techs if t.lower() in _JD_LIBRARIES]
             for line in existing.split('\n'):
                 l = line.strip()
                 # Detect entering/leaving skills section
-                if _re.match(r'^SKILLS?\s*$', l, _re.I):
+                if _RE_SKILLS_HDR.match(l):
                     in_skills = True
                     continue
-                if in_skills and _re.match(r'^(EDUCATION|EXPERIENCE|PROJECTS?|CERT|AWARD|SUMM|PROFILE|CONTACT)', l, _re.I) and len(l) < 30:
+                if in_skills and len(l) < 30 and _RE_SKILLS_END.match(l):
                     in_skills = False
                     continue
 
-                m = _re.match(r'^([^:]{2,50}):\s*(.+)$', l)
+                m = _RE_CAT_LINE.match(l)
                 if m:
                     cat = m.group(1).strip()
                     items = m.group(2).strip()
+                    cat_lower = cat.lower()
+                    cat_words = cat_lower.split()
                     # Skip contact fields
-                    if cat.lower().split()[0] in CONTACT_SKIP:
+                    if cat_words[0] in _CONTACT_SKIP:
                         continue
                     # Skip lines that look like sentences (contact info, coursework etc)
-                    if any(w in cat.lower() for w in ['coursework', 'relevant', 'specializ', 'email', 'phone']):
+                    if any(w in cat_lower for w in ['coursework', 'relevant', 'specializ', 'email', 'phone']):
                         continue
                     # Must be in skills section OR look like a skill category
-                    if not in_skills:
-                        cat_words = cat.lower().split()
-                        is_skill_cat = any(w in cat_words for w in
-                            ['programming','language','languages','ai','ml','data','science','libraries',
-                             'tools','developer','frameworks','technical','skills','software','cloud'])
-                        if not is_skill_cat:
-                            continue
+                    if not in_skills and _SKILL_CATEGORY_WORDS.isdisjoint(cat_words):
+                        continue
 
                     # Add JD terms to relevant categories
-                    cat_lower = cat.lower()
                     if 'lang' in cat_lower:
-                        for t in jd_techs:
-                            if t.lower() in {'python','java','c++','r','scala','golang'} and t.lower() not in items.lower():
-                                items += f', {t}'
+                        additions = jd_langs
                     elif any(w in cat_lower for w in ['lib','frame','tool']) and 'developer' not in cat_lower:
-                        for t in jd_techs:
-                            if t.lower() in {'tensorflow','pytorch','keras','numpy','pandas','scikit-learn','streamlit','fastapi','matplotlib','xgboost','lightgbm'} and t.lower() not in items.lower():
-                                items += f', {t}'
+                        additions = jd_libs
+                    else:
+                        additions = ()
+                    items_lower = items.lower()
+                    for t, t_lower in additions:
+                        if t_lower not in items_lower:
+                            items += f', {t}'
+                            items_lower += f', {t_lower}'
                     skill_lines.append(f"{cat}: {items}")
 
             if skill_lines:
@@ -577,17 +1112,16 @@ Be specific, practical, and professional. Focus on ATS optimization."""
             )
 
         elif normalized == 'projects':
-            import re as _re
             # Extract projects section from resume
             proj_lines = []
             in_proj = False
             for line in existing.split('\n'):
                 l = line.strip()
-                if _re.match(r'^PROJECTS?\s*$', l, _re.I):
+                if _RE_PROJECTS_HDR.match(l):
                     in_proj = True
                     continue
                 if in_proj:
-                    if _re.match(r'^(SKILLS?|EDUCATION|CERT|AWARD|SUMM|PROFILE|CONTACT|EXPERIENCE)', l, _re.I) and len(l) < 25:
+                    if len(l) < 25 and _RE_PROJECTS_END.match(l):
                         break
                     if l:
                         proj_lines.append(l)
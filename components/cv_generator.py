@@ -8,7 +8,7 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.lib import colors
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, HRFlowable, Table, TableStyle
+    SimpleDocTemplate, Paragraph, Spacer, HRFlowable, Table, TableStyle, Flowable
 )
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
@@ -21,8 +21,14 @@ MUTED    = colors.HexColor('#6B7280')   # gray
 DIVIDER  = colors.HexColor('#E5E7EB')   # light gray line
 WHITE    = colors.white
 
+# ── Column widths ────────────────────────────────────────────────────────────
+DATE_COL_W    = 38 * mm     # right-hand date column of experience/education rows
+SKILL_CAT_MIN = 35 * mm     # skills category column, clamped to this range
+SKILL_CAT_MAX = 55 * mm
+SKILL_CHAR_W  = 1.8 * mm    # approx. width per category character
 
-def _styles():
+
+def _build_styles():
     return {
         'name': ParagraphStyle('name', fontName='Helvetica-Bold',
                                fontSize=22, textColor=DARK,
@@ -60,9 +66,49 @@ def _styles():
         'edu_meta': ParagraphStyle('edu_meta', fontName='Helvetica-Oblique',
                                    fontSize=9, textColor=MUTED,
                                    spaceAfter=1, leading=12),
+        'date_right': ParagraphStyle('date_right', fontName='Helvetica',
+                                     fontSize=9, textColor=MUTED, alignment=TA_RIGHT),
     }
 
 
+# Styles are read-only during layout, so one set is shared by every build
+_STYLES = _build_styles()
+
+_SKILL_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0,0), (-1,-1), 'TOP'),
+    ('LEFTPADDING', (0,0), (-1,-1), 0),
+    ('RIGHTPADDING', (0,0), (-1,-1), 6),
+    ('TOPPADDING', (0,0), (-1,-1), 2),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 2),
+])
+
+
+class _DatedRow(Flowable):
+    """Title on the left, date right-aligned in a DATE_COL_W column, both top-aligned.
+
+    Lays out like a one-row, zero-padding Table without the Table's style
+    resolution and column sizing passes.
+    """
+
+    BOTTOM_PAD = 1
+
+    def __init__(self, title: Paragraph, date: Paragraph):
+        super().__init__()
+        self.title = title
+        self.date = date
+
+    def wrap(self, availWidth, availHeight):
+        self._title_h = self.title.wrap(availWidth - DATE_COL_W, availHeight)[1]
+        self._date_h = self.date.wrap(DATE_COL_W, availHeight)[1]
+        self.width = availWidth
+        self.height = max(self._title_h, self._date_h) + self.BOTTOM_PAD
+        return self.width, self.height
+
+    def draw(self):
+        self.title.drawOn(self.canv, 0, self.height - self._title_h)
+        self.date.drawOn(self.canv, self.width - DATE_COL_W, self.height - self._date_h)
+
+
 def _section_header(title: str, styles: dict) -> list:
     return [
         Paragraph(title.upper(), styles['section']),
@@ -70,6 +116,11 @@ def _section_header(title: str, styles: dict) -> list:
     ]
 
 
+def _bullet_block(lines: list, styles: dict) -> list:
+    """One bullet-style Paragraph per non-empty line, so spaceAfter separates bullets."""
+    return [Paragraph(line, styles['bullet']) for line in lines if line]
+
+
 def _safe(text: str) -> str:
     """Escape XML special chars for reportlab."""
     return (text or '').replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
@@ -97,7 +148,7 @@ def generate_resume_pdf(data: dict) -> bytes:
         topMargin=12 * mm, bottomMargin=12 * mm,
     )
 
-    S = _styles()
+    S = _STYLES
     story = []
 
     # ── HEADER ────────────────────────────────────────────────────────────────
@@ -141,24 +192,14 @@ def generate_resume_pdf(data: dict) -> bytes:
             date_str = f"{start} – {end}" if start else end
 
             # Title + date on same line
-            t_data = [[Paragraph(f"<b>{title}</b>", S['job_title']),
-                       Paragraph(date_str, ParagraphStyle('r', fontName='Helvetica',
-                                 fontSize=9, textColor=MUTED, alignment=TA_RIGHT))]]
-            t = Table(t_data, colWidths=[None, 38*mm])
-            t.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'),
-                                   ('LEFTPADDING', (0,0), (-1,-1), 0),
-                                   ('RIGHTPADDING', (0,0), (-1,-1), 0),
-                                   ('TOPPADDING', (0,0), (-1,-1), 0),
-                                   ('BOTTOMPADDING', (0,0), (-1,-1), 1)]))
-            story.append(t)
+            story.append(_DatedRow(Paragraph(f"<b>{title}</b>", S['job_title']),
+                                   Paragraph(date_str, S['date_right'])))
 
             company_loc = f"{company}" + (f", {loc}" if loc else '')
             story.append(Paragraph(company_loc, S['job_meta']))
 
-            for b in exp.get('bullets', []):
-                b = b.strip()
-                if b:
-                    story.append(Paragraph(f"- {_safe(b)}", S['bullet']))
+            story += _bullet_block([f"- {_safe(b.strip())}" for b in exp.get('bullets', [])
+                                    if b.strip()], S)
             story.append(Spacer(1, 4))
 
     # ── PROJECTS ──────────────────────────────────────────────────────────────
@@ -175,13 +216,10 @@ def generate_resume_pdf(data: dict) -> bytes:
             if tech:
                 header += f" <font color='#6B7280'>| {tech}</font>"
             story.append(Paragraph(header, S['job_title']))
-            for b in proj.get('bullets', []):
-                b = b.strip()
-                if b:
-                    story.append(Paragraph(f"- {_safe(b)}", S['bullet']))
+            lines = [f"- {_safe(b.strip())}" for b in proj.get('bullets', []) if b.strip()]
             if link:
-                story.append(Paragraph(
-                    f"<font color='#2563EB'>{link}</font>", S['bullet']))
+                lines.append(f"<font color='#2563EB'>{link}</font>")
+            story += _bullet_block(lines, S)
             story.append(Spacer(1, 4))
 
     # ── SKILLS ────────────────────────────────────────────────────────────────
@@ -200,15 +238,9 @@ def generate_resume_pdf(data: dict) -> bytes:
         if skill_rows:
             # Auto-size category column based on longest category name
             max_cat_len = max(len(s.get('category','')) for s in skills if s.get('category')) if skills else 10
-            cat_col_w = min(max(max_cat_len * 1.8 * mm, 35*mm), 55*mm)
+            cat_col_w = min(max(max_cat_len * SKILL_CHAR_W, SKILL_CAT_MIN), SKILL_CAT_MAX)
             t = Table(skill_rows, colWidths=[cat_col_w, None])
-            t.setStyle(TableStyle([
-                ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                ('LEFTPADDING', (0,0), (-1,-1), 0),
-                ('RIGHTPADDING', (0,0), (-1,-1), 6),
-                ('TOPPADDING', (0,0), (-1,-1), 2),
-                ('BOTTOMPADDING', (0,0), (-1,-1), 2),
-            ]))
+            t.setStyle(_SKILL_TABLE_STYLE)
             story.append(t)
 
     # ── EDUCATION ─────────────────────────────────────────────────────────────
@@ -227,16 +259,8 @@ def generate_resume_pdf(data: dict) -> bytes:
             courses = _safe(edu.get('courses', ''))
             date_str = f"{start} – {end}" if start and end else end or start
 
-            t_data = [[Paragraph(f"<b>{deg}</b>", S['edu_title']),
-                       Paragraph(date_str, ParagraphStyle('r2', fontName='Helvetica',
-                                 fontSize=9, textColor=MUTED, alignment=TA_RIGHT))]]
-            t = Table(t_data, colWidths=[None, 38*mm])
-            t.setStyle(TableStyle([('VALIGN', (0,0),(-1,-1),'TOP'),
-                                   ('LEFTPADDING',(0,0),(-1,-1),0),
-                                   ('RIGHTPADDING',(0,0),(-1,-1),0),
-                                   ('TOPPADDING',(0,0),(-1,-1),0),
-                                   ('BOTTOMPADDING',(0,0),(-1,-1),1)]))
-            story.append(t)
+            story.append(_DatedRow(Paragraph(f"<b>{deg}</b>", S['edu_title']),
+                                   Paragraph(date_str, S['date_right'])))
 
             inst_loc = inst + (f", {loc}" if loc else '')
             meta_parts = [inst_loc]
@@ -253,9 +277,7 @@ def generate_resume_pdf(data: dict) -> bytes:
     certs = [c for c in certs if c.strip()]
     if certs:
         story += _section_header('Certifications', S)
-        for c in certs:
-            story.append(Paragraph(f"- {_safe(c)}", S['bullet']))
+        story += _bullet_block([f"- {_safe(c)}" for c in certs], S)
 
     doc.build(story)
-    buf.seek(0)
-    return buf.read()
+    return buf.getvalue()
@@ -3,13 +3,19 @@ Keyword Analyzer v4 — strict filtering, no junk bigrams.
 """
 
 import re
-from dataclasses import dataclass, field
-from typing import List
-from sklearn.feature_extraction.text import TfidfVectorizer
+import math
+import functools
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from operator import attrgetter
+from typing import FrozenSet, List, Tuple
+import numpy as np
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
 from utils.text_processor import TextProcessor
 
 
-@dataclass
+@dataclass(slots=True)
 class Keyword:
     term: str
     tfidf_score: float
@@ -17,7 +23,7 @@ class Keyword:
     category: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MissingKeyword:
     term: str
     importance_score: float
@@ -26,7 +32,7 @@ class MissingKeyword:
     suggestions: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RankedKeyword:
     term: str
     importance_score: float
@@ -38,7 +44,7 @@ class RankedKeyword:
 
 # ── Whitelisted meaningful terms ──────────────────────────────────────────────
 
-TECH_TERMS = {
+TECH_TERMS = frozenset({
     # languages
     'python','java','javascript','typescript','c++','c#','golang','rust',
     'scala','kotlin','swift','r','matlab','bash','shell',
@@ -81,20 +87,30 @@ TECH_TERMS = {
     'linear algebra','cross-validation','dimensionality reduction',
     'spark sql','vertex ai','azure ml','ci/cd',
     'version control','open source',
-}
+})
 
-SOFT_SKILL_TERMS = {
+# Longest first, so free-text scans report the most specific term before its parts
+TECH_TERMS_LONGEST_FIRST = tuple(sorted(TECH_TERMS, key=len, reverse=True))
+
+SOFT_SKILL_TERMS = frozenset({
     'leadership','communication','teamwork','collaboration','problem solving',
     'analytical','creative','innovative','organized','detail oriented',
     'time management','adaptable','proactive','critical thinking',
     'presentation','negotiation','mentoring','cross-functional',
     'stakeholder management','independent','self-motivated','problem-solving',
-}
+})
+
+# One alternation per category for the substring fallback in _categorize;
+# terms are lowercase, so they're matched against lowercased text without re.I
+_RE_TECH_PART = re.compile('|'.join(
+    re.escape(t) for t in TECH_TERMS_LONGEST_FIRST if len(t) > 5))
+_RE_SOFT_PART = re.compile('|'.join(
+    re.escape(s) for s in sorted(SOFT_SKILL_TERMS, key=len, reverse=True) if len(s) > 7))
 
 # ── Definitive junk lists ─────────────────────────────────────────────────────
 
 # Any single word in this set → always junk
-JUNK_WORDS = {
+JUNK_WORDS = frozenset({
     # job posting boilerplate
     'bonus','currently','pursuing','recently','completed','ideal','motivated',
     'passionate','enthusiastic','eager','willing','ready','able','capable',
@@ -133,10 +149,10 @@ JUNK_WORDS = {
     'following','inference','deploy','deploying','efficient','efficiency',
     'effective','effectively','well','clean','written','documented',
     'exploratory','optimize','optimization','performance','accuracy',
-}
+})
 
 # Bigrams that are always junk regardless of anything
-JUNK_BIGRAMS = {
+JUNK_BIGRAMS = frozenset({
     'documented python','clean well','well documented','bonus experience',
     'bonus kaggle','ai products','cloud platforms','version control',
     'open source','engineering best','best practices','computing frameworks',
@@ -149,12 +165,41 @@ JUNK_BIGRAMS = {
     'stipend 15','15 000','000 month','per month','what offer',
     'inficore soft','artificial intelligence',
     'rank problems','explore deep','signal based','image text',
-}
+})
 
 # A bigram is only valid if BOTH words have value (not in JUNK_WORDS)
 # AND the phrase appears as a whole in the JD (freq >= 1)
 
 
+# ── Term weighting ────────────────────────────────────────────────────────────
+
+MAX_FEATURES = 300
+_RE_WORD = re.compile(r"(?u)\b\w\w+\b")
+
+
+def _term_weights(text: str) -> Tuple[List[str], List[float]]:
+    """Unigram + bigram weights for a single document, alphabetical by term.
+
+    With one document every idf is 1, so TF-IDF reduces to l2-normalised
+    counts. This reproduces TfidfVectorizer(ngram_range=(1, 2), max_features=300,
+    stop_words='english') exactly — same tokens, same tie-breaking when capping
+    the vocabulary — without building a vectorizer and sparse matrix per call.
+    """
+    tokens = [w for w in _RE_WORD.findall(text.lower()) if w not in ENGLISH_STOP_WORDS]
+    counts = Counter(tokens)
+    counts.update(map(' '.join, zip(tokens, tokens[1:])))
+    if not counts:
+        return [], []
+
+    names = sorted(counts)
+    if len(names) > MAX_FEATURES:
+        tfs = np.fromiter(map(counts.__getitem__, names), dtype=np.int64, count=len(names))
+        names = [names[i] for i in np.sort((-tfs).argsort()[:MAX_FEATURES])]
+
+    norm = math.sqrt(sum(counts[n] ** 2 for n in names))
+    return names, [counts[n] / norm for n in names]
+
+
 class KeywordAnalyzer:
 
     def __init__(self):
@@ -165,29 +210,28 @@ class KeywordAnalyzer:
     def extract_keywords(self, job_desc: str) -> List[Keyword]:
         if not job_desc or len(job_desc.strip()) < 10:
             return []
+        # Copies, so callers can't mutate the cached entries
+        return [replace(kw) for kw in _cached_keywords(job_desc)]
 
+    def _extract_keywords(self, job_desc: str) -> List[Keyword]:
         normalized = self.text_processor.normalize(job_desc)
-        vectorizer = TfidfVectorizer(
-            ngram_range=(1, 2), max_features=300,
-            stop_words='english', min_df=1,
-        )
-        try:
-            mat = vectorizer.fit_transform([normalized, normalized])
-            names  = vectorizer.get_feature_names_out()
-            scores = mat[0].toarray()[0]
-        except Exception:
+        names, scores = _term_weights(normalized)
+        if not names:
             return []
 
         stop_words = self.text_processor.get_stop_words()
+        jd_lower = job_desc.lower()
+        is_junk, categorize = self._is_junk, self._categorize
         keywords: List[Keyword] = []
 
         for term, score in zip(names, scores):
             if score == 0:
                 continue
-            if self._is_junk(term, stop_words):
+            if is_junk(term, stop_words):
                 continue
 
-            freq = job_desc.lower().count(term.lower())
+            t = term.lower()
+            freq = jd_lower.count(t)
             words = term.split()
 
             # Bigrams: must actually appear together in JD
@@ -195,7 +239,7 @@ class KeywordAnalyzer:
                 continue
 
             # Single non-whitelisted words: must appear ≥2 times
-            cat = self._categorize(term)
+            cat = categorize(term)
             if cat == 'general' and len(words) == 1 and freq < 2:
                 continue
 
@@ -203,18 +247,18 @@ class KeywordAnalyzer:
             if len(words) == 2 and cat == 'general':
                 continue
 
-            keywords.append(Keyword(term=term, tfidf_score=float(score),
-                                    frequency=freq, category=cat))
+            # Boost whitelisted terms
+            score = float(score)
+            if t in TECH_TERMS:
+                score *= 2.5
+            elif t in SOFT_SKILL_TERMS:
+                score *= 1.5
 
-        # Boost whitelisted terms
-        for kw in keywords:
-            if kw.term.lower() in TECH_TERMS:
-                kw.tfidf_score *= 2.5
-            elif kw.term.lower() in SOFT_SKILL_TERMS:
-                kw.tfidf_score *= 1.5
+            keywords.append(Keyword(term=term, tfidf_score=score,
+                                    frequency=freq, category=cat))
 
-        keywords.sort(key=lambda k: k.tfidf_score, reverse=True)
-        return keywords[:50]
+        # Same order as a stable descending sort, without sorting the tail
+        return heapq.nlargest(50, keywords, key=attrgetter('tfidf_score'))
 
     def find_missing_keywords(self, resume_text: str,
                                job_keywords: List[Keyword]) -> List[MissingKeyword]:
@@ -224,45 +268,42 @@ class KeywordAnalyzer:
         resume_lower = resume_text.lower()
         stop_words   = self.text_processor.get_stop_words()
         missing      = []
+        # JD phrases share words, so each containment test runs once per call
+        present      = {}
+
+        def contains(w: str) -> bool:
+            hit = present.get(w)
+            if hit is None:
+                hit = present[w] = w in resume_lower
+            return hit
 
         for kw in job_keywords:
             tl = kw.term.lower().strip()
 
-            # Direct match
-            if tl in resume_lower:
+            # Direct match (also covers punctuated tokens like "pytorch,")
+            if contains(tl):
                 continue
 
             words = tl.split()
 
-            if len(words) == 1:
-                # Single word — also check with common variants (e.g. "pytorch" matches "pytorch,")
-                if any(tl == w.strip('.,;:/()') for w in resume_lower.split()):
-                    continue
-                # Not found
-                missing.append(MissingKeyword(
-                    term=kw.term,
-                    importance_score=kw.tfidf_score * (1 + min(kw.frequency, 5) * 0.15),
-                    category=kw.category,
-                    context=self._context(kw.category),
-                    suggestions=self._suggestions(kw.term, kw.category),
-                ))
-            else:
+            if len(words) > 1:
                 # Multi-word phrase — skip if ALL significant words are present individually
                 sig = [w for w in words
                        if len(w) > 2 and w not in stop_words and w not in JUNK_WORDS]
-                if sig and all(w in resume_lower for w in sig):
+                if sig and all(map(contains, sig)):
                     continue
                 # Also skip if the phrase appears as a substring with any separator
                 phrase_no_space = re.sub(r'\s+', r'.{0,3}', re.escape(tl))
                 if re.search(phrase_no_space, resume_lower):
                     continue
-                missing.append(MissingKeyword(
-                    term=kw.term,
-                    importance_score=kw.tfidf_score * (1 + min(kw.frequency, 5) * 0.15),
-                    category=kw.category,
-                    context=self._context(kw.category),
-                    suggestions=self._suggestions(kw.term, kw.category),
-                ))
+
+            missing.append(MissingKeyword(
+                term=kw.term,
+                importance_score=kw.tfidf_score * (1 + min(kw.frequency, 5) * 0.15),
+                category=kw.category,
+                context=self._context(kw.category),
+                suggestions=self._suggestions(kw.term, kw.category),
+            ))
 
         return missing
 
@@ -293,7 +334,7 @@ class KeywordAnalyzer:
 
     # ── private helpers ───────────────────────────────────────────────────────
 
-    def _is_junk(self, term: str, stop_words: set) -> bool:
+    def _is_junk(self, term: str, stop_words: FrozenSet[str]) -> bool:
         t = term.lower().strip()
 
         if len(t) < 3:
@@ -307,8 +348,8 @@ class KeywordAnalyzer:
         if all(w in stop_words or w in JUNK_WORDS for w in words):
             return True
 
-        # Any digit sequence → junk (catches "15 000", "000 month" etc.)
-        if re.search(r'\b\d+\b', t):
+        # Any all-digit word → junk (catches "15 000", "000 month" etc.)
+        if any(w.isdecimal() for w in words):
             return True
 
         # Single word that's explicitly junk
@@ -331,14 +372,10 @@ class KeywordAnalyzer:
         if t in TECH_TERMS:
             return 'technical'
         # Substring match for long tech terms
-        for tech in TECH_TERMS:
-            if len(tech) > 5 and tech in t:
-                return 'technical'
-        if t in SOFT_SKILL_TERMS:
+        if _RE_TECH_PART.search(t):
+            return 'technical'
+        if t in SOFT_SKILL_TERMS or _RE_SOFT_PART.search(t):
             return 'soft_skill'
-        for s in SOFT_SKILL_TERMS:
-            if len(s) > 7 and s in t:
-                return 'soft_skill'
         return 'general'
 
     def _context(self, cat: str) -> str:
@@ -361,3 +398,12 @@ class KeywordAnalyzer:
                 f"Use '{term}' in your professional summary.",
             ]
         return [f"Incorporate '{term}' naturally where relevant."]
+
+
+# ── Per-JD cache ──────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=32)
+def _cached_keywords(job_desc: str) -> Tuple[Keyword, ...]:
+    """Keyword extraction is deterministic in the JD text, and the same JD is
+    usually analysed against several resumes."""
+    return tuple(KeywordAnalyzer()._extract_keywords(job_desc))
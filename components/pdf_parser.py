@@ -1,10 +1,12 @@
 """
 PDF Parser Component
-Extracts and preprocesses text from PDF files using pdfplumber (primary) and PyPDF2 (fallback).
+Extracts and preprocesses text from PDF files using pdfplumber (primary),
+PDFium and PyPDF2 (fallbacks).
 """
 
 import re
 import io
+import codecs
 from dataclasses import dataclass, field
 from typing import BinaryIO, List
 
@@ -14,6 +16,12 @@ try:
 except ImportError:
     PDFPLUMBER_AVAILABLE = False
 
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
 try:
     import pypdf as PyPDF2  # modern package name
     PYPDF2_AVAILABLE = True
@@ -25,6 +33,58 @@ except ImportError:
         PYPDF2_AVAILABLE = False
 
 
+# ── Preprocessing patterns ────────────────────────────────────────────────────
+
+_RE_SQUISHED_HEADER = re.compile(
+    r'(TECHNICAL|WORK|PERSONAL|SENIOR|JUNIOR|SOFT|KEY)'
+    r'(EXPERIENCE|SKILLS?|PROJECTS?|SUMMARY|PROFILE)')
+# camelCase, ACRONYMWord, letter→digit and digit→letter boundaries. The four
+# alternatives never match at the same position and none creates or removes a
+# match for another, so one pass inserts exactly what four passes did.
+_RE_SQUISHED_BOUNDARY = re.compile(
+    r'(?<=[a-z])(?=[A-Z])|(?<=[A-Z]{2})(?=[A-Z][a-z])'
+    r'|(?<=[a-zA-Z])(?=[0-9])|(?<=[0-9])(?=[a-zA-Z])')
+_RE_SQUISHED_JOINER = re.compile(
+    r'(?<=[a-z])(at|in|on|is|are|was|for|and|the|of|to|with|by|from|as)(?=[A-Z])')
+# Both fixes below need 11+ characters without a space (a squished header, or a
+# word longer than the 10-char average), so lines without such a run are skipped
+_RE_LONG_RUN   = re.compile(r'[^ ]{11}')
+_RE_BLANK_RUN  = re.compile(r'\n{3,}')
+_RE_SPACE_RUN  = re.compile(r'[ \t]{2,}')
+_RE_CONTROL    = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+# The ASCII encoder passes each whole run of unencodable chars to the handler,
+# so this maps every non-ASCII run to one space, like re.sub(r'[^\x00-\x7F]+', ' ')
+_NON_ASCII_RUN_TO_SPACE = 'ats.non_ascii_run_to_space'
+codecs.register_error(_NON_ASCII_RUN_TO_SPACE, lambda err: (' ', err.end))
+
+
+def _fix_squished(line: str) -> str:
+    """Fix squished words — insert space before capital letters in long runs."""
+    if not _RE_LONG_RUN.search(line):
+        return line
+    stripped = line.strip()
+    if not stripped:
+        return line
+
+    # Always fix ALL-CAPS squished section headers (e.g. TECHNICALEXPERIENCE)
+    # These are lines that are fully uppercase and longer than 10 chars with no spaces
+    if stripped.isupper() and len(stripped) > 10 and ' ' not in stripped:
+        # Insert space before known section words
+        fixed = _RE_SQUISHED_HEADER.sub(r'\1 \2', stripped)
+        if fixed != stripped:
+            return fixed
+
+    words = stripped.split()
+    avg_word_len = sum(len(w) for w in words) / max(len(words), 1)
+    if avg_word_len > 10:
+        # Split on camelCase and letter/digit boundaries
+        line = _RE_SQUISHED_BOUNDARY.sub(' ', line)
+        # Split known word boundaries using common prefixes/suffixes
+        line = _RE_SQUISHED_JOINER.sub(r' \1 ', line)
+    return line
+
+
 @dataclass
 class TextExtractionResult:
     text: str
@@ -51,7 +111,9 @@ class PDFParser:
     def _read_bytes(self, pdf_file) -> bytes:
         """Safely read all bytes from a file-like object (handles Streamlit UploadedFile)."""
         try:
-            # Streamlit UploadedFile: use .getvalue() if available (most reliable)
+            # Streamlit UploadedFile: use .getvalue() if available (most reliable).
+            # On a BytesIO this returns the buffer's own bytes object, not a copy,
+            # and io.BytesIO(pdf_bytes) shares it again until written to.
             if hasattr(pdf_file, 'getvalue'):
                 return pdf_file.getvalue()
             # Regular file-like: seek to start then read
@@ -115,6 +177,18 @@ class PDFParser:
             except Exception as e:
                 errors.append(f"pdfplumber failed: {str(e)}")
 
+        # Fallback to PDFium — native extractor, much faster than PyPDF2 but
+        # without pdfplumber's layout mode (table rows can split across lines)
+        if PDFIUM_AVAILABLE:
+            try:
+                result = self._extract_with_pdfium(pdf_bytes)
+                if result.success:
+                    result.errors = errors + result.errors
+                    return result
+                errors.append("PDFium extracted insufficient text, trying fallback.")
+            except Exception as e:
+                errors.append(f"PDFium failed: {str(e)}")
+
         # Fallback to PyPDF2
         if PYPDF2_AVAILABLE:
             try:
@@ -135,32 +209,54 @@ class PDFParser:
 
     def _extract_with_pdfplumber(self, pdf_file) -> TextExtractionResult:
         """Extract text using pdfplumber with layout-aware settings."""
-        pages_text = []
-        page_count = 0
-
         with pdfplumber.open(pdf_file) as pdf:
             page_count = len(pdf.pages)
-            for page in pdf.pages:
-                # Try layout-aware extraction first (fixes squished text in columnar PDFs)
-                try:
-                    text = page.extract_text(layout=True, x_tolerance=3, y_tolerance=3)
-                except TypeError:
-                    text = page.extract_text(x_tolerance=3, y_tolerance=3)
+            processed = self._preprocess_pages(
+                self._pdfplumber_page_text(page) for page in pdf.pages)
 
-                if not text:
-                    text = page.extract_text()
+        return TextExtractionResult(
+            text=processed,
+            page_count=page_count,
+            extraction_method="pdfplumber",
+            confidence=0.95 if len(processed) > self.MIN_TEXT_LENGTH else 0.3,
+            success=len(processed) >= self.MIN_TEXT_LENGTH
+        )
+
+    @staticmethod
+    def _pdfplumber_page_text(page) -> str:
+        # Try layout-aware extraction first (fixes squished text in columnar PDFs)
+        try:
+            text = page.extract_text(layout=True, x_tolerance=3, y_tolerance=3)
+        except TypeError:
+            text = page.extract_text(x_tolerance=3, y_tolerance=3)
 
-                if text:
-                    pages_text.append(text)
+        if not text:
+            text = page.extract_text()
+        return text
+
+    def _extract_with_pdfium(self, pdf_bytes: bytes) -> TextExtractionResult:
+        """Extract text using PDFium (pypdfium2)."""
+        def page_texts(pdf):
+            for page in pdf:
+                textpage = page.get_textpage()
+                try:
+                    yield textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
 
-        raw_text = "\n".join(pages_text)
-        processed = self.preprocess_text(raw_text)
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            page_count = len(pdf)
+            processed = self._preprocess_pages(page_texts(pdf))
+        finally:
+            pdf.close()
 
         return TextExtractionResult(
             text=processed,
             page_count=page_count,
-            extraction_method="pdfplumber",
-            confidence=0.95 if len(processed) > self.MIN_TEXT_LENGTH else 0.3,
+            extraction_method="PDFium",
+            confidence=0.85 if len(processed) > self.MIN_TEXT_LENGTH else 0.25,
             success=len(processed) >= self.MIN_TEXT_LENGTH
         )
 
@@ -171,15 +267,7 @@ class PDFParser:
         except AttributeError:
             reader = PyPDF2.PdfFileReader(pdf_file)
         page_count = len(reader.pages)
-        pages_text = []
-
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                pages_text.append(text)
-
-        raw_text = "\n".join(pages_text)
-        processed = self.preprocess_text(raw_text)
+        processed = self._preprocess_pages(page.extract_text() for page in reader.pages)
 
         return TextExtractionResult(
             text=processed,
@@ -189,6 +277,12 @@ class PDFParser:
             success=len(processed) >= self.MIN_TEXT_LENGTH
         )
 
+    def _preprocess_pages(self, pages) -> str:
+        """Clean each page as it is extracted and join the non-empty results."""
+        # preprocess_text is line-local and drops blank lines, so this matches
+        # cleaning the joined document without building the raw copy first
+        return "\n".join(filter(None, map(self.preprocess_text, pages)))
+
     def preprocess_text(self, raw_text: str) -> str:
         """Clean and normalize extracted text."""
         if not raw_text:
@@ -197,48 +291,19 @@ class PDFParser:
         # Normalize whitespace and line endings
         text = raw_text.replace('\r\n', '\n').replace('\r', '\n')
 
-        # Fix squished words — insert space before capital letters in long runs
-        import re as _re
-        def fix_squished(line):
-            stripped = line.strip()
-            if not stripped:
-                return line
-
-            # Always fix ALL-CAPS squished section headers (e.g. TECHNICALEXPERIENCE)
-            # These are lines that are fully uppercase and longer than 10 chars with no spaces
-            if stripped.isupper() and len(stripped) > 10 and ' ' not in stripped:
-                # Insert space before known section words
-                fixed = _re.sub(
-                    r'(TECHNICAL|WORK|PERSONAL|SENIOR|JUNIOR|SOFT|KEY)'
-                    r'(EXPERIENCE|SKILLS?|PROJECTS?|SUMMARY|PROFILE)',
-                    r'\1 \2', stripped)
-                if fixed != stripped:
-                    return fixed
-
-            words = stripped.split()
-            avg_word_len = sum(len(w) for w in words) / max(len(words), 1)
-            if avg_word_len > 10:
-                # Split on camelCase boundaries
-                line = _re.sub(r'(?<=[a-z])(?=[A-Z])', ' ', line)
-                line = _re.sub(r'(?<=[A-Z]{2})(?=[A-Z][a-z])', ' ', line)
-                # Split on letter→digit and digit→letter
-                line = _re.sub(r'(?<=[a-zA-Z])(?=[0-9])', ' ', line)
-                line = _re.sub(r'(?<=[0-9])(?=[a-zA-Z])', ' ', line)
-                # Split known word boundaries using common prefixes/suffixes
-                line = _re.sub(r'(?<=[a-z])(at|in|on|is|are|was|for|and|the|of|to|with|by|from|as)(?=[A-Z])', r' \1 ', line)
-            return line
-
         lines = text.split('\n')
-        lines = [fix_squished(line) for line in lines]
+        lines = [_fix_squished(line) for line in lines]
         text = '\n'.join(lines)
 
         # Remove excessive whitespace while preserving structure
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r'[ \t]{2,}', ' ', text)
+        text = _RE_BLANK_RUN.sub('\n\n', text)
+        text = _RE_SPACE_RUN.sub(' ', text)
 
         # Remove common PDF artifacts
-        text = re.sub(r'[^\x00-\x7F]+', ' ', text)  # non-ASCII (icons/symbols)
-        text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)  # control chars
+        if not text.isascii():
+            # non-ASCII (icons/symbols)
+            text = text.encode('ascii', _NON_ASCII_RUN_TO_SPACE).decode('ascii')
+        text = _RE_CONTROL.sub('', text)  # control chars
 
         # Clean up lines
         lines = [line.strip() for line in text.split('\n')]
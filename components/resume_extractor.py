@@ -4,7 +4,7 @@ Handles messy PDF text where bullets aren't separated by blank lines.
 """
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Optional
 
 
@@ -25,6 +25,101 @@ class ParsedResume:
     certifications: List[str] = field(default_factory=list)
 
 
+# Resume characters sent to the AI parsers (a character budget, not bytes)
+MAX_PROMPT_CHARS = 4500
+
+_PARSED_FIELDS = frozenset(f.name for f in fields(ParsedResume))
+
+
+def _parsed_resume_from(data: dict) -> ParsedResume:
+    """Build a ParsedResume from AI JSON; unknown keys are ignored and missing
+    ones fall back to the field defaults (fresh lists via default_factory)."""
+    return ParsedResume(**{k: v for k, v in data.items() if k in _PARSED_FIELDS})
+
+
+# ── Precompiled patterns ──────────────────────────────────────────────────────
+
+# AI response clean-up
+_RE_FENCE_OPEN  = re.compile(r'^```(?:json)?\s*\n?')
+_RE_FENCE_CLOSE = re.compile(r'\n?```\s*$')
+
+# Pre-clean of squished PDF text before the AI prompt
+_RE_CAMEL_SPLIT   = re.compile(r'(?<=[a-z])(?=[A-Z])')
+_RE_ACRONYM_SPLIT = re.compile(r'(?<=[A-Z]{2})(?=[A-Z][a-z])')
+_RE_SPACE_RUN     = re.compile(r'[ \t]{2,}')
+_RE_JOB_TITLE_LINE = re.compile(
+    r'\n((?:Lead|Senior|Junior|Staff|Principal|ML|AI|Software|Data|Cloud|Backend|Frontend|Full[\s-]?Stack)'
+    r'\s+\w+[\w\s]*?\s+\d{2}/\d{2,4})')
+_RE_COMPANY_LINE = re.compile(
+    r'(\d{2}/\d{2,4})\n([A-Z][^\n]{2,40}(?:Remote|Delhi|Mumbai|Bangalore|Hyderabad|Noida|USA|UK|IN)\b)')
+
+# Contact details and top-of-resume lines
+# The leftmost email always starts where a [\w.+-] run starts, so the lookbehind
+# keeps the search from re-scanning every word from each of its characters
+_RE_EMAIL    = re.compile(r'(?<![\w.+-])[\w.+-]+@[\w.-]+\.[a-z]{2,}')
+_RE_PHONE    = re.compile(r'\+?[\d][\d\s\-().]{7,15}[\d]')
+_RE_LINKEDIN = re.compile(r'linkedin\.com/in/[\w\-]+', re.I)
+_RE_GITHUB   = re.compile(r'github\.com/[\w\-]+(?!/[\w])', re.I)
+_RE_NOT_NAME    = re.compile(r'[@\d|]')
+_RE_NOT_TAGLINE = re.compile(r'@|\+\d|\d{8,}')
+
+# Section-header normalisation (applied to the upper-cased header)
+_RE_TECH_EXPERIENCE = re.compile(r'TECHNICAL\s+EXPERIENCE')
+_RE_TECH_SKILLS     = re.compile(r'TECHNICAL\s+SKILLS?')
+
+# Section bodies
+_RE_SKILL_LINE     = re.compile(r'^([^:]{2,50}):\s*(.+)$')
+_RE_EDU_DATE_TAIL  = re.compile(r'\s+\d{2}/\d{4}.*$')
+_RE_EDU_DATE_RANGE = re.compile(r'(\d{2}/\d{4})\s+[-–]\s*(\S+)')
+_RE_STARTS_DATE    = re.compile(r'^\d{2}/\d{4}')
+_RE_EDU_LOCATION_TAIL = re.compile(r'\b([A-Z][a-z]{2,}(?:,\s*[A-Z][a-z]+)?)\s*$')
+_RE_COURSEWORK     = re.compile(r'coursework', re.I)
+_RE_COURSEWORK_PREFIX = re.compile(r'.*?coursework[:\s]*', re.I)
+_RE_GPA_LINE       = re.compile(r'\bgpa\b|\bcgpa\b|%', re.I)
+_RE_GPA_VALUE      = re.compile(r'[\d.]+\s*/\s*[\d.]+|[\d.]+\s*%')
+_RE_LOCATION_LINE  = re.compile(r'^[A-Z][a-z]+(?:,\s*[A-Z][a-z]+)?$')
+_RE_TECH_PREFIX    = re.compile(r'^Technologies?:', re.I)
+_RE_TECH_STRIP     = re.compile(r'^Technologies?:\s*', re.I)
+_RE_EXP_DATE_RANGE = re.compile(r'(\w+[\s/]\d{4})\s*[-–]\s*(\w+[\s/]\d{4}|present)', re.I)
+_RE_DATE           = re.compile(r'\d{2}/\d{4}')
+_RE_DATE_ONLY      = re.compile(r'^\d{2}/\d{4}\s*[-–]')
+_RE_DATE_RANGE     = re.compile(r'(\d{2}/\d{4})\s*[-–]\s*(\d{2}/\d{4}|\w+)')
+_RE_PROJ_DATE_TAIL = re.compile(r',?\s*\d{2}/\d{4}.*$')
+_RE_YEAR           = re.compile(r'\b20\d{2}\b')
+
+
+# ── Section headers ───────────────────────────────────────────────────────────
+
+def _section_key(header_upper: str) -> str:
+    """Normalize an upper-cased header — check full phrase before falling back to first word."""
+    if _RE_TECH_EXPERIENCE.match(header_upper):
+        return 'EXPERIENCE'
+    if _RE_TECH_SKILLS.match(header_upper):
+        return 'SKILLS'
+    key = header_upper.split()[0]
+    return {'PROFILE': 'SUMMARY', 'ABOUT': 'SUMMARY', 'WORK': 'EXPERIENCE',
+            'EMPLOYMENT': 'EXPERIENCE', 'PERSONAL': 'PROJECTS',
+            'TECHNICAL': 'SKILLS', 'COURSE': 'CERTIFICATIONS',
+            'TRAINING': 'CERTIFICATIONS', 'AWARD': 'AWARDS',
+            'ACHIEVEMENT': 'AWARDS', 'HONOR': 'AWARDS'}.get(key, key)
+
+
+# Every fixed section header (upper-cased, single-spaced) → its section key,
+# so a line is classified with one dict lookup instead of a regex alternation
+_HEADER_KEYS = {h: _section_key(h) for h in (
+    'PROFILE', 'SUMMARY', 'ABOUT', 'ABOUT ME', 'OBJECTIVE',
+    'EDUCATION', 'ACADEMIC',
+    'SKILL', 'SKILLS', 'TECHNICAL SKILL', 'TECHNICAL SKILLS',
+    'TECHNICAL EXPERIENCE', 'EXPERIENCE', 'WORK EXPERIENCE', 'EMPLOYMENT',
+    'PROJECT', 'PROJECTS', 'PERSONAL PROJECT', 'PERSONAL PROJECTS',
+    'CERTIFICATION', 'CERTIFICATIONS', 'COURSE', 'COURSES', 'TRAINING',
+    'INTERNSHIP', 'INTERNSHIPS',
+    'AWARD', 'AWARDS', 'ACHIEVEMENT', 'ACHIEVEMENTS', 'HONOR', 'HONORS',
+    'PUBLICATION', 'PUBLICATIONS', 'LANGUAGE', 'LANGUAGES',
+    'INTEREST', 'INTERESTS', 'ACTIVITIE', 'ACTIVITIES',
+)}
+# The original header regex, kept for non-ASCII lines: str.upper() expands
+# ligatures ('ﬁ' → 'FI', 'ß' → 'SS'), so those can't go through the dict
 SECTION_HEADERS = re.compile(
     r'^(PROFILE|SUMMARY|ABOUT(?:\s+ME)?|OBJECTIVE|'
     r'EDUCATION|ACADEMIC|'
@@ -37,6 +132,55 @@ SECTION_HEADERS = re.compile(
     r'LANGUAGES?|INTERESTS?|ACTIVITIES?)\s*$',
     re.IGNORECASE
 )
+# Internship headers may carry a free-form tail ("INTERNSHIPS / CERTIFICATIONS AND COURSES")
+_RE_INTERNSHIP_HEADER = re.compile(
+    r'^INTERNSHIPS?(?:[\s/]+CERTIFICATIONS?(?:[\s\w]*)?)?\s*$', re.IGNORECASE)
+
+
+def _header_key(stripped: str) -> Optional[str]:
+    """Section key if the stripped line is a section header, else None."""
+    if not stripped.isascii():
+        return _section_key(stripped.upper()) if SECTION_HEADERS.match(stripped) else None
+    upper = stripped.upper()
+    key = _HEADER_KEYS.get(' '.join(upper.split()))
+    if key is None and upper.startswith('INTERNSHIP') and _RE_INTERNSHIP_HEADER.match(stripped):
+        key = _section_key(upper)
+    return key
+
+
+# ── Line classifiers ──────────────────────────────────────────────────────────
+# Cheap character tests rule most lines out before the regex runs.
+
+def _is_tech_line(l: str) -> bool:
+    """'Technologies:' / 'Technology:' label line (any case)."""
+    return l[:1] in ('T', 't') and _RE_TECH_PREFIX.match(l) is not None
+
+
+def _starts_with_date(l: str) -> bool:
+    """Line starts with an MM/YYYY date."""
+    return l[2:3] == '/' and _RE_STARTS_DATE.match(l) is not None
+
+
+def _is_date_only(l: str) -> bool:
+    """Line is an 'MM/YYYY - ...' date range on its own."""
+    return l[2:3] == '/' and _RE_DATE_ONLY.match(l) is not None
+
+
+def _is_project_header(line: str) -> bool:
+    """A line is a new project header if it looks like a title (not a sentence)."""
+    l = line.strip()
+    if not l or l[0] in '•-–*' or _is_tech_line(l):
+        return False
+    # Has a date → likely a header
+    if '/' in l and _RE_DATE.search(l):
+        return True
+    # Long sentence-like lines, and lines ending in '.' (body text) or ','
+    # (wrapped mid-sentence), are NOT headers
+    if len(l) > 120 or l[-1] in '.,':
+        return False
+    # Lines with lots of lowercase words mid-sentence are body text
+    words = l.split()
+    return len(words) <= 6 or sum(w[0].islower() for w in words[1:]) <= 3
 
 
 def extract_resume_structure(text: str, gemini_model=None, suggester=None) -> ParsedResume:
@@ -53,13 +197,20 @@ def extract_resume_structure(text: str, gemini_model=None, suggester=None) -> Pa
     return _extract_with_regex(text)
 
 
+def _strip_fences(raw: str) -> str:
+    """Strip markdown code fences around a JSON reply."""
+    if '```' in raw:  # most replies are bare JSON — skip both regex passes
+        raw = _RE_FENCE_CLOSE.sub('', _RE_FENCE_OPEN.sub('', raw))
+    return raw.strip()
+
+
 def _extract_with_gemini(text: str, model) -> Optional[ParsedResume]:
     import json
 
     prompt = f"""Parse this resume into structured JSON. Extract ALL content accurately.
 
 RESUME TEXT:
-{text[:4500]}
+{text[:MAX_PROMPT_CHARS]}
 
 Return ONLY valid JSON (no markdown, no backticks):
 {{
@@ -112,14 +263,9 @@ Rules:
 
     try:
         resp = model.generate_content(prompt)
-        raw = resp.text.strip()
-        # Strip markdown code fences
-        raw = re.sub(r'^```(?:json)?\s*\n?', '', raw)
-        raw = re.sub(r'\n?```\s*$', '', raw)
-        raw = raw.strip()
+        raw = _strip_fences(resp.text.strip())
         data = json.loads(raw)
-        return ParsedResume(**{k: data.get(k, v)
-                               for k, v in ParsedResume().__dict__.items()})
+        return _parsed_resume_from(data)
     except Exception as e:
         print(f"Gemini parse error: {e}")
         return None
@@ -130,29 +276,24 @@ def _extract_with_ai(text: str, suggester) -> Optional[ParsedResume]:
     import json
 
     # Pre-clean squished PDF text before sending to AI
-    import re as _re
     clean = text
     # Fix camelCase squish: MLengineer → ML engineer
-    clean = _re.sub(r'(?<=[a-z])(?=[A-Z])', ' ', clean)
-    clean = _re.sub(r'(?<=[A-Z]{2})(?=[A-Z][a-z])', ' ', clean)
+    clean = _RE_CAMEL_SPLIT.sub(' ', clean)
+    clean = _RE_ACRONYM_SPLIT.sub(' ', clean)
     # Normalize repeated spaces
-    clean = _re.sub(r'[ \t]{2,}', ' ', clean)
+    clean = _RE_SPACE_RUN.sub(' ', clean)
 
     # Insert blank lines before likely job title lines (e.g. "ML Engineer(Full-time) 01/2023 05/2023")
     # Pattern: line starting with a job-title-like phrase followed by dates
-    clean = _re.sub(
-        r'\n((?:Lead|Senior|Junior|Staff|Principal|ML|AI|Software|Data|Cloud|Backend|Frontend|Full[\s-]?Stack)'
-        r'\s+\w+[\w\s]*?\s+\d{2}/\d{2,4})',
-        r'\n\n\1', clean)
+    clean = _RE_JOB_TITLE_LINE.sub(r'\n\n\1', clean)
 
     # Also insert blank line before company lines that follow a job title date line
-    clean = _re.sub(r'(\d{2}/\d{2,4})\n([A-Z][^\n]{2,40}(?:Remote|Delhi|Mumbai|Bangalore|Hyderabad|Noida|USA|UK|IN)\b)',
-                    r'\1\n\n\2', clean)
+    clean = _RE_COMPANY_LINE.sub(r'\1\n\n\2', clean)
 
     prompt = f"""Parse this resume into structured JSON. Extract ALL content accurately.
 
 RESUME TEXT:
-{clean[:4500]}
+{clean[:MAX_PROMPT_CHARS]}
 
 Return ONLY valid JSON (no markdown, no backticks):
 {{
@@ -213,13 +354,9 @@ Rules:
 9. If text is squished (no spaces between words), use context to determine word boundaries"""
 
     try:
-        raw = suggester._call_model(prompt)
-        raw = re.sub(r'^```(?:json)?\s*\n?', '', raw)
-        raw = re.sub(r'\n?```\s*$', '', raw)
-        raw = raw.strip()
+        raw = _strip_fences(suggester._call_model(prompt))
         data = json.loads(raw)
-        return ParsedResume(**{k: data.get(k, v)
-                               for k, v in ParsedResume().__dict__.items()})
+        return _parsed_resume_from(data)
     except Exception as e:
         print(f"AI resume parse error: {e}")
         return None
@@ -227,65 +364,43 @@ Rules:
 
 def _extract_with_regex(text: str) -> ParsedResume:
     result = ParsedResume()
-    lines = [l.rstrip() for l in text.split('\n')]
+    # Strip once; every consumer below works on stripped lines
+    lines = [l.strip() for l in text.split('\n')]
 
     # ── contact ───────────────────────────────────────────────────────────────
-    em = re.search(r'[\w.+-]+@[\w.-]+\.[a-z]{2,}', text)
+    em = _RE_EMAIL.search(text) if '@' in text else None
     if em: result.email = em.group(0)
 
-    ph = re.search(r'\+?[\d][\d\s\-().]{7,15}[\d]', text)
-    if ph: result.phone = re.sub(r'\s+', ' ', ph.group(0)).strip()
+    ph = _RE_PHONE.search(text)
+    if ph: result.phone = ' '.join(ph.group(0).split())
 
-    li = re.search(r'linkedin\.com/in/[\w\-]+', text, re.I)
+    li = _RE_LINKEDIN.search(text)
     if li: result.linkedin = li.group(0)
 
-    gh = re.search(r'github\.com/[\w\-]+(?!/[\w])', text, re.I)
+    gh = _RE_GITHUB.search(text)
     if gh: result.github = gh.group(0)
 
     # Name & tagline from top lines
-    for i, line in enumerate(lines[:5]):
-        l = line.strip()
-        if l and len(l.split()) <= 6 and not re.search(r'[@\d|]', l) and not result.name:
+    for i, l in enumerate(lines[:5]):
+        if l and len(l.split()) <= 6 and not _RE_NOT_NAME.search(l) and not result.name:
             result.name = l
         elif (l and result.name and len(l) < 80
-              and not re.search(r'@|\+\d|\d{8,}', l)
+              and not _RE_NOT_TAGLINE.search(l)
               and 'linkedin' not in l.lower() and not result.tagline):
             result.tagline = l
 
     # ── split into labelled sections ──────────────────────────────────────────
     sections = {}
-    current_key = None
-    current_lines = []
-
-    for line in lines:
-        stripped = line.strip()
-        if SECTION_HEADERS.match(stripped):
-            if current_key is not None:
-                sections.setdefault(current_key, []).extend(current_lines)
-            # Normalize key — check full phrase before falling back to first word
-            stripped_upper = stripped.upper()
-            if re.match(r'TECHNICAL\s+EXPERIENCE', stripped_upper):
-                key = 'EXPERIENCE'
-            elif re.match(r'TECHNICAL\s+SKILLS?', stripped_upper):
-                key = 'SKILLS'
-            else:
-                key = stripped_upper.split()[0]
-                key = {'PROFILE': 'SUMMARY', 'ABOUT': 'SUMMARY', 'WORK': 'EXPERIENCE',
-                       'EMPLOYMENT': 'EXPERIENCE', 'PERSONAL': 'PROJECTS',
-                       'TECHNICAL': 'SKILLS', 'COURSE': 'CERTIFICATIONS',
-                       'TRAINING': 'CERTIFICATIONS', 'AWARD': 'AWARDS',
-                       'ACHIEVEMENT': 'AWARDS', 'HONOR': 'AWARDS'}.get(key, key)
-            current_key = key
-            current_lines = []
-        elif current_key is not None:
-            current_lines.append(line)
-
-    if current_key is not None:
-        sections.setdefault(current_key, []).extend(current_lines)
+    keys = [_header_key(line) for line in lines]
+    starts = [i for i, key in enumerate(keys) if key is not None]
+    # Each section body is the slice up to the next header; text above the
+    # first header (name, contact) belongs to no section
+    for start, end in zip(starts, starts[1:] + [len(lines)]):
+        sections.setdefault(keys[start], []).extend(lines[start + 1:end])
 
     # ── parse each section ────────────────────────────────────────────────────
     if 'SUMMARY' in sections:
-        result.summary = ' '.join(l.strip() for l in sections['SUMMARY'] if l.strip())
+        result.summary = ' '.join(l for l in sections['SUMMARY'] if l)
 
     if 'SKILLS' in sections:
         result.skills = _parse_skills(sections['SKILLS'])
@@ -304,7 +419,7 @@ def _extract_with_regex(text: str) -> ParsedResume:
 
     # Awards: single merged entry, not split into certifications
     if 'AWARDS' in sections:
-        award_lines = [l.strip() for l in sections['AWARDS'] if l.strip()]
+        award_lines = [l for l in sections['AWARDS'] if l]
         if award_lines:
             # Merge into single award entry
             merged = _merge_award_lines(award_lines)
@@ -319,7 +434,7 @@ def _parse_skills(lines: list) -> list:
         l = line.strip()
         if not l:
             continue
-        m = re.match(r'^([^:]{2,50}):\s*(.+)$', l)
+        m = _RE_SKILL_LINE.match(l)
         if m:
             skills.append({'category': m.group(1).strip(), 'items': m.group(2).strip()})
     return skills
@@ -338,11 +453,11 @@ def _parse_education(lines: list) -> list:
 
         if any(kw in l.lower() for kw in ['bachelor','b.tech','master','m.tech','phd','b.e','mba','b.sc','bachelor']):
             # Strip trailing dates
-            dm = re.search(r'\s+\d{2}/\d{4}.*$', l)
+            dm = _RE_EDU_DATE_TAIL.search(l)
             if dm:
                 date_part = l[dm.start():]
                 l = l[:dm.start()].strip()
-                dr = re.search(r'(\d{2}/\d{4})\s+[-–]\s*(\S+)', date_part)
+                dr = _RE_EDU_DATE_RANGE.search(date_part)
                 if dr:
                     edu['start'] = dr.group(1)
                     edu['end']   = dr.group(2)
@@ -354,18 +469,18 @@ def _parse_education(lines: list) -> list:
             else:
                 edu['degree'] = l
 
-        elif re.match(r'^\d{2}/\d{4}', l):
-            dr = re.search(r'(\d{2}/\d{4})\s+[-–]\s*(\S+)', l)
+        elif _starts_with_date(l):
+            dr = _RE_EDU_DATE_RANGE.search(l)
             if dr:
                 edu['start'] = dr.group(1)
                 edu['end']   = dr.group(2)
-            loc_m = re.search(r'\b([A-Z][a-z]{2,}(?:,\s*[A-Z][a-z]+)?)\s*$', l)
+            loc_m = _RE_EDU_LOCATION_TAIL.search(l)
             if loc_m:
                 edu['location'] = loc_m.group(1)
 
-        elif re.search(r'coursework', l, re.I):
+        elif _RE_COURSEWORK.search(l):
             capturing_courses = True
-            c = re.sub(r'.*?coursework[:\s]*', '', l, flags=re.I).strip().lstrip('•– ')
+            c = _RE_COURSEWORK_PREFIX.sub('', l).strip().lstrip('•– ')
             if c:
                 course_buffer.append(c)
 
@@ -375,11 +490,11 @@ def _parse_education(lines: list) -> list:
             else:
                 capturing_courses = False
 
-        elif re.search(r'\bgpa\b|\bcgpa\b|%', l, re.I):
-            gm = re.search(r'[\d.]+\s*/\s*[\d.]+|[\d.]+\s*%', l)
+        elif _RE_GPA_LINE.search(l):
+            gm = _RE_GPA_VALUE.search(l)
             if gm: edu['gpa'] = gm.group(0)
 
-        elif not edu['location'] and re.match(r'^[A-Z][a-z]+(?:,\s*[A-Z][a-z]+)?$', l):
+        elif not edu['location'] and _RE_LOCATION_LINE.match(l):
             edu['location'] = l
 
     if course_buffer:
@@ -391,6 +506,9 @@ def _parse_education(lines: list) -> list:
 def _parse_experience(lines: list) -> list:
     entries = []
     current = None
+    is_tech_line = _is_tech_line
+    date_range = _RE_EXP_DATE_RANGE.search
+    strip_tech = _RE_TECH_STRIP.sub
 
     for line in lines:
         l = line.strip()
@@ -401,19 +519,19 @@ def _parse_experience(lines: list) -> list:
             continue
 
         is_bullet = l.startswith(('•', '-', '*', '–', '·'))
-        is_tech   = re.match(r'^Technologies?:', l, re.I)
+        is_tech   = is_tech_line(l)
 
         if is_bullet or is_tech:
             if current:
                 b = l.lstrip('•-*–· ')
                 if is_tech:
-                    current['tech'] = re.sub(r'^Technologies?:\s*', '', l, flags=re.I)
+                    current['tech'] = strip_tech('', l)
                 elif len(b) > 5:
                     current['bullets'].append(b)
         elif current is None:
             current = {'title': l, 'company': '', 'location': '',
                        'start': '', 'end': 'Present', 'bullets': []}
-            dm = re.search(r'(\w+[\s/]\d{4})\s*[-–]\s*(\w+[\s/]\d{4}|present)', l, re.I)
+            dm = date_range(l)
             if dm:
                 current['start'] = dm.group(1)
                 current['end']   = dm.group(2)
@@ -440,31 +558,12 @@ def _parse_projects(lines: list) -> list:
     entries = []
     current = None
     last_was_tech = False
-
-    def _is_project_header(line: str) -> bool:
-        """A line is a new project header if it looks like a title (not a sentence)."""
-        l = line.strip()
-        if not l or l.startswith(('•', '-', '–', '*')):
-            return False
-        if re.match(r'^Technologies?:', l, re.I):
-            return False
-        # Has a date → likely a header
-        if re.search(r'\d{2}/\d{4}', l):
-            return True
-        # Very long sentence-like lines are NOT headers
-        if len(l) > 120:
-            return False
-        # Lines ending with period are body text
-        if l.endswith('.'):
-            return False
-        # Lines ending with comma are wrapped mid-sentence
-        if l.endswith(','):
-            return False
-        # Lines with lots of lowercase words mid-sentence are body text
-        words = l.split()
-        if len(words) > 6 and sum(1 for w in words[1:] if w[0].islower()) > 3:
-            return False
-        return True
+    # Each bullet is collected as a list of fragments and joined once at the end
+    # Hot per-line loop: bind the classifiers and pattern methods to locals
+    is_tech_line, is_date_only_line, is_header = _is_tech_line, _is_date_only, _is_project_header
+    date_range = _RE_DATE_RANGE.search
+    strip_tech = _RE_TECH_STRIP.sub
+    strip_date_tail = _RE_PROJ_DATE_TAIL.sub
 
     for line in lines:
         l = line.strip()
@@ -472,8 +571,8 @@ def _parse_projects(lines: list) -> list:
             continue
 
         is_bullet   = l.startswith(('•', '-', '–', '*', '·'))
-        is_tech     = bool(re.match(r'^Technologies?:', l, re.I))
-        is_date_only= bool(re.match(r'^\d{2}/\d{4}\s*[-–]', l))
+        is_tech     = is_tech_line(l)
+        is_date_only= is_date_only_line(l)
         is_subtitle = ('|' in l and len(l) < 120 and not is_bullet
                        and current is not None and not is_tech)
         # Continuation: starts lowercase OR starts with connecting words
@@ -484,7 +583,7 @@ def _parse_projects(lines: list) -> list:
 
         if is_date_only:
             if current:
-                dm = re.search(r'(\d{2}/\d{4})\s*[-–]\s*(\d{2}/\d{4}|\w+)', l)
+                dm = date_range(l)
                 if dm:
                     current['start'] = dm.group(1)
                     current['end']   = dm.group(2)
@@ -492,7 +591,7 @@ def _parse_projects(lines: list) -> list:
 
         elif is_tech:
             if current:
-                current['tech'] = re.sub(r'^Technologies?:\s*', '', l, flags=re.I).strip()
+                current['tech'] = strip_tech('', l).strip()
             last_was_tech = True
 
         elif is_subtitle:
@@ -503,32 +602,32 @@ def _parse_projects(lines: list) -> list:
                 current = {'name':'','tech':'','link':'','start':'','end':'','bullets':[]}
             b = l.lstrip('•-–*· ').strip()
             if b:
-                current['bullets'].append(b)
+                current['bullets'].append([b])
             last_was_tech = False
 
         elif is_continuation and not last_was_tech:
             if current and current['bullets']:
-                current['bullets'][-1] += ' ' + l
+                current['bullets'][-1].append(l)
             elif current:
-                current['bullets'].append(l)
+                current['bullets'].append([l])
             last_was_tech = False
 
-        elif last_was_tech or (current is not None and _is_project_header(l)):
+        elif last_was_tech or (current is not None and is_header(l)):
             # New project
             if current and current['name']:
                 entries.append(current)
-            clean = re.sub(r',?\s*\d{2}/\d{4}.*$', '', l).strip().rstrip(',').strip()
+            clean = strip_date_tail('', l).strip().rstrip(',').strip()
             current = {'name': clean, 'tech': '', 'link': '', 'start': '', 'end': '', 'bullets': []}
-            dm = re.search(r'(\d{2}/\d{4})\s*[-–]\s*(\d{2}/\d{4}|\w+)', l)
+            dm = date_range(l)
             if dm:
                 current['start'] = dm.group(1)
                 current['end']   = dm.group(2)
             last_was_tech = False
 
-        elif current is None and _is_project_header(l):
-            clean = re.sub(r',?\s*\d{2}/\d{4}.*$', '', l).strip().rstrip(',').strip()
+        elif current is None and is_header(l):
+            clean = strip_date_tail('', l).strip().rstrip(',').strip()
             current = {'name': clean, 'tech': '', 'link': '', 'start': '', 'end': '', 'bullets': []}
-            dm = re.search(r'(\d{2}/\d{4})\s*[-–]\s*(\d{2}/\d{4}|\w+)', l)
+            dm = date_range(l)
             if dm:
                 current['start'] = dm.group(1)
                 current['end']   = dm.group(2)
@@ -538,12 +637,14 @@ def _parse_projects(lines: list) -> list:
             # Plain text content line — add as bullet
             if current is not None:
                 if len(l) > 10:
-                    current['bullets'].append(l)
+                    current['bullets'].append([l])
             last_was_tech = False
 
     if current and current['name']:
         entries.append(current)
 
+    for e in entries:
+        e['bullets'] = [' '.join(parts) for parts in e['bullets']]
     return entries
 
 
@@ -555,7 +656,7 @@ def _parse_certs(lines: list) -> list:
         if not l:
             continue
         # New entry if line has a year or starts with capital
-        has_year = bool(re.search(r'\b20\d{2}\b', l))
+        has_year = bool(_RE_YEAR.search(l))
         if not buf:
             buf = l
         elif has_year and len(buf) > 20:
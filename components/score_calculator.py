@@ -3,14 +3,26 @@ Score Calculator Component
 Computes ATS compatibility scores using TF-IDF similarity.
 """
 
+import re
+import math
+import functools
+from collections import Counter
 from dataclasses import dataclass
-from typing import Tuple
+from typing import FrozenSet, Tuple
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
 from utils.text_processor import TextProcessor
 
 
+MAX_FEATURES = 5000
+_RE_TOKEN = re.compile(r"(?u)\b\w\w+\b")   # TfidfVectorizer's token_pattern
+# Metric words: keeps tech punctuation (c++, c#, node.js, ci-cd) but drops
+# trailing sentence punctuation, so "python," and "python." match "python"
+_RE_METRIC_WORD = re.compile(r"[a-z][a-z0-9+#.\-]*[a-z0-9+#]")
+# Smoothed idf of a term found in only one of two documents: ln(3/2) + 1
+_IDF_ONE_DOC = math.log(3 / 2) + 1
+
+
 @dataclass
 class ScoreMetrics:
     raw_similarity: float
@@ -33,12 +45,6 @@ class ScoreCalculator:
 
     def __init__(self):
         self.text_processor = TextProcessor()
-        self.vectorizer = TfidfVectorizer(
-            ngram_range=(1, 2),
-            max_features=5000,
-            stop_words='english',
-            sublinear_tf=True
-        )
 
     def calculate_similarity(self, resume_text: str, job_desc: str) -> float:
         """Calculate TF-IDF cosine similarity between resume and job description."""
@@ -46,14 +52,9 @@ class ScoreCalculator:
             return 0.0
 
         processed_resume = self.text_processor.normalize(resume_text)
-        processed_job = self.text_processor.normalize(job_desc)
+        processed_job = _normalized_job(job_desc)
 
-        try:
-            tfidf_matrix = self.vectorizer.fit_transform([processed_resume, processed_job])
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            return float(similarity)
-        except Exception:
-            return 0.0
+        return _pair_similarity(processed_resume, processed_job)
 
     def normalize_score(self, similarity: float) -> int:
         """Normalize raw similarity to 0-100 scale using calibrated thresholds.
@@ -87,16 +88,17 @@ class ScoreCalculator:
         similarity = self.calculate_similarity(resume_text, job_desc)
         score = self.normalize_score(similarity)
 
+        resume_words = set(_RE_METRIC_WORD.findall(resume_text.lower()))
+        job_words = set(_RE_METRIC_WORD.findall(job_desc.lower()))
+        stops = self.text_processor.get_stop_words()
+
         # Technical match: ratio of technical terms found
-        resume_words = set(resume_text.lower().split())
-        job_words = set(job_desc.lower().split())
-        tech_terms = self._get_technical_terms(job_words)
+        tech_terms = self._get_technical_terms(job_words, stops)
         tech_match = len(tech_terms & resume_words) / max(len(tech_terms), 1)
 
         # Keyword density
-        job_keywords = job_words - self.text_processor.get_stop_words()
-        resume_words_lower = set(resume_text.lower().split())
-        keyword_density = len(job_keywords & resume_words_lower) / max(len(job_keywords), 1)
+        job_keywords = job_words - stops
+        keyword_density = len(job_keywords & resume_words) / max(len(job_keywords), 1)
 
         # Length ratio (resumes shouldn't be too short vs job desc)
         length_ratio = min(len(resume_text) / max(len(job_desc), 1), 3.0)
@@ -109,7 +111,50 @@ class ScoreCalculator:
             length_ratio=round(length_ratio, 3)
         )
 
-    def _get_technical_terms(self, words: set) -> set:
+    def _get_technical_terms(self, words: set, stops: FrozenSet[str]) -> set:
         """Identify likely technical terms (no common English words)."""
-        common = self.text_processor.get_stop_words()
-        return {w for w in words if w not in common and len(w) > 3 and w.isalpha()}
+        return {w for w in words if w not in stops and len(w) > 3 and w.isalpha()}
+
+
+@functools.lru_cache(maxsize=32)
+def _normalized_job(job_desc: str) -> str:
+    """Normalized JD text, cached so repeat scoring against one JD skips it."""
+    return TextProcessor().normalize(job_desc)
+
+
+def _ngram_counts(text: str) -> Counter:
+    """Unigram + bigram counts with TfidfVectorizer's tokens and stop words."""
+    tokens = [w for w in _RE_TOKEN.findall(text.lower()) if w not in ENGLISH_STOP_WORDS]
+    counts = Counter(tokens)
+    counts.update(map(' '.join, zip(tokens, tokens[1:])))
+    return counts
+
+
+def _pair_similarity(doc_a: str, doc_b: str) -> float:
+    """Cosine similarity of two documents under TfidfVectorizer's weighting.
+
+    With only two documents the fit is trivial — idf is 1 for shared terms and
+    ln(3/2) + 1 for the rest — so this reproduces TfidfVectorizer(ngram_range=
+    (1, 2), max_features=5000, stop_words='english', sublinear_tf=True) plus
+    cosine_similarity without building a vocabulary and sparse matrix per call.
+    """
+    counts_a, counts_b = _ngram_counts(doc_a), _ngram_counts(doc_b)
+    vocab = counts_a.keys() | counts_b.keys()
+    if len(vocab) > MAX_FEATURES:
+        # Same cap as max_features: top corpus counts over the sorted vocabulary
+        names = sorted(vocab)
+        tfs = np.fromiter((counts_a[n] + counts_b[n] for n in names),
+                          dtype=np.int64, count=len(names))
+        vocab = {names[i] for i in (-tfs).argsort()[:MAX_FEATURES]}
+
+    shared = counts_a.keys() & counts_b.keys() & vocab
+    if not shared:
+        return 0.0
+
+    def weights(counts: Counter) -> dict:
+        return {t: (1 + math.log(c)) * (1.0 if t in shared else _IDF_ONE_DOC)
+                for t, c in counts.items() if t in vocab}
+
+    w_a, w_b = weights(counts_a), weights(counts_b)
+    norm = math.sqrt(sum(v * v for v in w_a.values()) * sum(v * v for v in w_b.values()))
+    return sum(w_a[t] * w_b[t] for t in shared) / norm
@@ -3,12 +3,33 @@ Section Evaluator Component
 Analyzes and scores individual resume sections.
 """
 
+import os
 import re
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-
-
-@dataclass
+import functools
+import threading
+from dataclasses import dataclass, field, replace
+from operator import attrgetter
+from typing import Dict, FrozenSet, List, Optional
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Opt-in RE2 backend (pip install google-re2; ATS_USE_RE2=1): linear-time matching
+# on untrusted resume text. Off by default — per-call overhead makes it slower
+# than re on short lines — and read once, since patterns compile at import.
+USE_RE2 = RE2_AVAILABLE and os.getenv("ATS_USE_RE2", "").strip() == "1"
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+@dataclass(slots=True)
 class Section:
     name: str
     content: str
@@ -16,7 +37,7 @@ class Section:
     end_idx: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionScore:
     section_name: str
     score: int  # 0-100
@@ -27,7 +48,7 @@ class SectionScore:
     improvement_areas: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CompletenessReport:
     total_score: int
     present_sections: List[str]
@@ -82,6 +103,150 @@ SECTION_PATTERNS = {
 REQUIRED_SECTIONS = {'contact', 'skills', 'experience', 'education'}
 OPTIONAL_SECTIONS = {'summary', 'projects', 'certifications', 'achievements'}
 
+# Longer job descriptions bypass the section-score cache to bound its memory
+MAX_CACHED_JD_CHARS = 4096
+
+# ── Precompiled patterns ──────────────────────────────────────────────────────
+# Compiled once at import instead of going through re's cache on every call
+
+def _compile(pattern: str, ignore_case: bool = False):
+    """Compile with RE2 when enabled, else (or if RE2 rejects the syntax) with re.
+
+    RE2 has no lookaround, so those patterns go straight to re.
+    """
+    if USE_RE2 and not any(a in pattern for a in ('(?<', '(?=', '(?!')):
+        try:
+            return re2.compile(('(?i)' if ignore_case else '') + pattern)
+        except Exception:
+            pass
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+
+# One alternation per section: a line matches the section if any of its patterns do
+SECTION_UNION = {
+    name: _compile('|'.join(f'(?:{p})' for p in patterns), ignore_case=True)
+    for name, patterns in SECTION_PATTERNS.items()
+}
+
+# Contact details in the first lines of the resume
+_CONTACT_HEADER_PATTERNS = tuple(_compile(p, ignore_case=True) for p in (
+    r'(?<![\w.+-])[\w.+-]+@[\w.-]+\.[a-z]{2,}',
+    r'\+?\d[\d\s\-().]{7,15}\d',
+    r'linkedin\.com',
+    r'github\.com',
+))
+_RE_FIELD_LINE = _compile(r'\w+\s*:\s*\w')   # "Skills: Python" — content, not a header
+
+# Heuristic detection (run on lower-cased text)
+_RE_HEUR_CONTACT    = _compile(r'\b(email|phone|linkedin|github|@)\b')
+_RE_HEUR_SKILLS     = _compile(r'\b(python|java|sql|excel|aws|react)\b')
+_RE_HEUR_EXPERIENCE = _compile(r'\b(intern|engineer|developer|analyst|manager|worked|responsible)\b')
+_RE_HEUR_EDUCATION  = _compile(r'\b(university|college|bachelor|master|degree|b\.tech|m\.tech|bsc|msc)\b')
+
+# Section scorers
+# The lookbehind starts the local part only at a run boundary; without it, a long
+# run of word characters with no '@' is rescanned from every offset (quadratic)
+_RE_EMAIL         = _compile(r'(?<![\w.+-])[\w.+-]+@[\w.-]+\.[a-z]{2,}')
+_RE_PHONE         = _compile(r'\+?\d[\d\s\-().]{7,}')
+_RE_SKILL_WORD    = _compile(r'\b[a-z][a-z0-9+#.]{1,20}\b')
+_RE_SKILL_GROUPS  = _compile(r'(technical|soft|tools|languages|frameworks)')
+_RE_QUANTIFIED    = _compile(r'\d+%|\$[\d,]+|\d+\s*(users?|customers?|projects?|million|thousand)',
+                             ignore_case=True)
+_RE_EXP_DATE      = _compile(r'\b(20\d{2}|19\d{2}|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b',
+                             ignore_case=True)
+_RE_INSTITUTION   = _compile(r'(university|college|institute|school)')
+_RE_YEAR          = _compile(r'(20\d{2}|19\d{2})')
+_RE_GRADE         = _compile(r'(cgpa|gpa|percentage|grade)')
+_RE_PROJECT_START = _compile(r'\n[A-Z]')
+_RE_PROJECT_LINK  = _compile(r'(github|gitlab|demo|link|url|http)', ignore_case=True)
+_RE_PROJECT_VERB  = _compile(r'\b(built|developed|created|designed|implemented)\b', ignore_case=True)
+
+_ACTION_VERBS = ('developed', 'built', 'led', 'managed', 'designed', 'implemented',
+                 'improved', 'created', 'delivered', 'achieved', 'increased', 'reduced')
+_DEGREE_TERMS = ('bachelor', 'master', 'phd', 'b.tech', 'm.tech', 'bsc', 'msc', 'b.e', 'm.e',
+                 'degree', 'diploma')
+
+
+# ── Section matching ──────────────────────────────────────────────────────────
+
+# Every SECTION_PATTERNS entry requires one of these substrings, so a lower-cased
+# ASCII line containing none of them cannot match any section. (Non-ASCII lines
+# skip the prefilter: under IGNORECASE 'ſ', 'ı' and 'K' match ASCII letters.)
+_SECTION_TRIGGERS = (
+    'contact', 'personal', 'phone', 'email', 'address', 'linkedin', 'github',
+    'summary', 'profile', 'objective', 'overview', 'about', 'career',
+    'skill', 'competencies', 'expertise', 'technologies', 'tool',
+    'experience', 'history', 'background', 'employment', 'internship', 'position',
+    'education', 'academic', 'degree', 'qualification', 'university', 'college', 'school',
+    'project', 'portfolio',
+    'certification', 'license', 'credential', 'course', 'training',
+    'award', 'achievement', 'accomplishment', 'honor', 'recognition',
+    'publication', 'presentation',
+)
+
+
+def _may_match_section(line_lower: str) -> bool:
+    """Cheap substring test: False only if no section pattern can match."""
+    return not line_lower.isascii() or any(t in line_lower for t in _SECTION_TRIGGERS)
+
+
+# Optional Hyperscan database of every section pattern: one scan reports all
+# sections a line matches, instead of one regex search per section
+def _build_section_db():
+    names = list(SECTION_PATTERNS)
+    exprs = [(p.encode(), i) for i, n in enumerate(names) for p in SECTION_PATTERNS[n]]
+    try:
+        db = hyperscan.Database()
+        db.compile(expressions=[e for e, _ in exprs], ids=[i for _, i in exprs],
+                   elements=len(exprs),
+                   flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(exprs))
+    except Exception as e:
+        print(f"[ATS] Hyperscan section database unavailable: {e}")
+        return None, names
+    return db, names
+
+
+_HS_DB, _HS_NAMES = _build_section_db() if HYPERSCAN_AVAILABLE else (None, [])
+_hs_local = threading.local()   # scratch space is per thread (Streamlit sessions)
+# Python's \s also matches \x1c-\x1f; PCRE's does not. \s is the only construct
+# in SECTION_PATTERNS that can match them, so scanning them as spaces is exact.
+_HS_SPACES = bytes.maketrans(bytes(range(0x1c, 0x20)), b' ' * 4)
+
+
+def _on_section_hit(pattern_id, start, end, flags, hits):
+    hits.add(_HS_NAMES[pattern_id])
+
+
+def _hs_section_hits(line_lower: str) -> Optional[FrozenSet[str]]:
+    """Every section the line matches, or None when Hyperscan can't decide it.
+
+    Only ASCII lines are scanned: Hyperscan's caseless and \\s semantics match
+    Python's there, while non-ASCII lines keep the re path.
+    """
+    if _HS_DB is None or not line_lower.isascii():
+        return None
+    scratch = getattr(_hs_local, 'scratch', None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(_HS_DB)
+    hits = set()
+    _HS_DB.scan(line_lower.encode().translate(_HS_SPACES),
+                match_event_handler=_on_section_hit, context=hits, scratch=scratch)
+    return frozenset(hits)
+
+
+_NO_SECTIONS: FrozenSet[str] = frozenset()
+
+
+def _line_sections(line_lower: str) -> FrozenSet[str]:
+    """Every section whose patterns match the (stripped, lower-cased) line."""
+    if not _may_match_section(line_lower):
+        return _NO_SECTIONS
+    hits = _hs_section_hits(line_lower)
+    if hits is None:
+        hits = frozenset(name for name, pattern in SECTION_UNION.items()
+                         if pattern.search(line_lower))
+    return hits
+
 
 class SectionEvaluator:
     """Analyzes and scores individual resume sections."""
@@ -92,33 +257,36 @@ class SectionEvaluator:
             return {}
 
         lines = resume_text.split('\n')
+        cleaned = [line.strip().lower() for line in lines]
+        # One pass classifies every line: the sections a short line names, and —
+        # for header-shaped lines — the sections whose content it would end
+        line_hits = [_line_sections(c) if 0 < len(c) <= 60 else _NO_SECTIONS for c in cleaned]
+        header_hits = [hits if hits and self._is_header_shaped(c) else _NO_SECTIONS
+                       for c, hits in zip(cleaned, line_hits)]
         identified = {}
 
-        for i, line in enumerate(lines):
-            line_clean = line.strip().lower()
-            if not line_clean or len(line_clean) > 60:
+        for i, hits in enumerate(line_hits):
+            if not hits:
                 continue
-
-            for section_name, patterns in SECTION_PATTERNS.items():
-                if section_name in identified:
+            for section_name in SECTION_UNION:
+                if section_name in identified or section_name not in hits:
                     continue
-                for pattern in patterns:
-                    if re.search(pattern, line_clean, re.IGNORECASE):
-                        # Collect content until next section header
-                        content_lines = []
-                        for j in range(i + 1, min(i + 50, len(lines))):
-                            next_line = lines[j].strip().lower()
-                            if next_line and self._is_section_header(next_line, section_name):
-                                break
-                            content_lines.append(lines[j])
-
-                        identified[section_name] = Section(
-                            name=section_name,
-                            content='\n'.join(content_lines),
-                            start_idx=i,
-                            end_idx=i + len(content_lines)
-                        )
+                # Collect content until the next header of a different section
+                limit = min(i + 50, len(lines))
+                end = limit
+                for j in range(i + 1, limit):
+                    ends = header_hits[j]
+                    if ends and (len(ends) > 1 or section_name not in ends):
+                        end = j
                         break
+                content_lines = lines[i + 1:end]
+
+                identified[section_name] = Section(
+                    name=section_name,
+                    content='\n'.join(content_lines),
+                    start_idx=i,
+                    end_idx=i + len(content_lines)
+                )
 
         # If no sections found, treat full text as one blob and guess
         if not identified:
@@ -129,20 +297,14 @@ class SectionEvaluator:
         if 'contact' not in identified:
             header_lines = resume_text.split('\n')[:6]
             header_text = '\n'.join(header_lines)
-            has_contact = any(
-                re.search(pat, header_text, re.IGNORECASE)
-                for pat in [r'[\w.+-]+@[\w.-]+\.[a-z]{2,}',
-                            r'\+?\d[\d\s\-().]{7,15}\d',
-                            r'linkedin\.com',
-                            r'github\.com']
-            )
+            has_contact = any(pat.search(header_text) for pat in _CONTACT_HEADER_PATTERNS)
             if has_contact:
                 identified['contact'] = Section('contact', header_text, 0, 6)
 
         return identified
 
-    def _is_section_header(self, line: str, current_section: str) -> bool:
-        """Check if a line is a different section header.
+    def _is_header_shaped(self, line: str) -> bool:
+        """Check if a line is shaped like a section header (ignoring its words).
         
         A true section header is:
         - Short (< 45 chars)
@@ -153,35 +315,28 @@ class SectionEvaluator:
         if len(line) > 45:
             return False
         # Skip lines with "word: content" pattern (skill categories, contact fields etc.)
-        if re.search(r'\w+\s*:\s*\w', line):
+        if _RE_FIELD_LINE.search(line):
             return False
         # Skip lines that are clearly bullet content
         if line.startswith(('•', '-', '*', '·')):
             return False
-        
-        for section_name, patterns in SECTION_PATTERNS.items():
-            if section_name == current_section:
-                continue
-            for pattern in patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    return True
-        return False
+        return True
 
     def _heuristic_detection(self, text: str) -> Dict[str, Section]:
         """Fallback: detect sections by common content patterns."""
         detected = {}
         text_lower = text.lower()
 
-        if re.search(r'\b(email|phone|linkedin|github|@)\b', text_lower):
+        if _RE_HEUR_CONTACT.search(text_lower):
             detected['contact'] = Section('contact', text[:200], 0, 200)
 
-        if re.search(r'\b(python|java|sql|excel|aws|react)\b', text_lower):
+        if _RE_HEUR_SKILLS.search(text_lower):
             detected['skills'] = Section('skills', text, 0, len(text))
 
-        if re.search(r'\b(intern|engineer|developer|analyst|manager|worked|responsible)\b', text_lower):
+        if _RE_HEUR_EXPERIENCE.search(text_lower):
             detected['experience'] = Section('experience', text, 0, len(text))
 
-        if re.search(r'\b(university|college|bachelor|master|degree|b\.tech|m\.tech|bsc|msc)\b', text_lower):
+        if _RE_HEUR_EDUCATION.search(text_lower):
             detected['education'] = Section('education', text, 0, len(text))
 
         return detected
@@ -192,19 +347,18 @@ class SectionEvaluator:
 
     def score_section(self, section: Section, job_desc: str) -> SectionScore:
         """Score a specific section based on completeness and relevance."""
-        scorers = {
-            'contact': self._score_contact,
-            'summary': self._score_summary,
-            'skills': self._score_skills,
-            'experience': self._score_experience,
-            'education': self._score_education,
-            'projects': self._score_projects,
-            'certifications': self._score_certifications,
-            'achievements': self._score_achievements,
-        }
-
-        scorer = scorers.get(section.name, self._score_generic)
-        return scorer(section, job_desc)
+        if len(job_desc) > MAX_CACHED_JD_CHARS:
+            return self._score_section(section, job_desc)
+        # Only the contact scorer reads the full text; keeping it out of the other
+        # keys means an edit elsewhere in the resume doesn't evict every section
+        full_text = getattr(self, '_full_resume_text', '') if section.name == 'contact' else ''
+        score = _cached_section_score(section.name, section.content, job_desc, full_text)
+        # Copy, so callers can't mutate the cached entry
+        return replace(score, improvement_areas=list(score.improvement_areas))
+
+    def _score_section(self, section: Section, job_desc: str) -> SectionScore:
+        scorer = _SCORERS.get(section.name, SectionEvaluator._score_generic)
+        return scorer(self, section, job_desc)
 
     def evaluate_completeness(self, sections: Dict[str, Section]) -> CompletenessReport:
         """Evaluate overall resume completeness."""
@@ -215,7 +369,7 @@ class SectionEvaluator:
         for name, section in sections.items():
             section_scores[name] = self.score_section(section, "")
 
-        total = int(sum(s.score for s in section_scores.values()) / max(len(section_scores), 1))
+        total = int(sum(map(attrgetter('score'), section_scores.values())) / max(len(section_scores), 1))
 
         # Penalize for missing required sections
         penalty = len(missing) * 10
@@ -249,22 +403,22 @@ class SectionEvaluator:
         improvements = []
         score = 40  # base
 
-        if re.search(r'[\w.+-]+@[\w.-]+\.[a-z]{2,}', search_text):
+        if _RE_EMAIL.search(search_text):
             score += 20
         else:
             improvements.append("Add your email address.")
 
-        if re.search(r'\+?\d[\d\s\-().]{7,}', search_text):
+        if _RE_PHONE.search(search_text):
             score += 15
         else:
             improvements.append("Add your phone number.")
 
-        if re.search(r'linkedin', search_text):
+        if 'linkedin' in search_text:
             score += 15
         else:
             improvements.append("Add your LinkedIn profile URL.")
 
-        if re.search(r'github', search_text):
+        if 'github' in search_text:
             score += 10
         else:
             improvements.append("Consider adding your GitHub profile.")
@@ -296,7 +450,7 @@ class SectionEvaluator:
             improvements.append("Summary is too long — keep it concise (under 80 words).")
 
         if job_desc:
-            job_words = set(job_desc.lower().split())
+            job_words = _job_words(job_desc)
             summary_words = set(content.lower().split())
             overlap = len(job_words & summary_words)
             if overlap > 5:
@@ -318,7 +472,7 @@ class SectionEvaluator:
         score = 30
 
         # Count distinct skill tokens
-        words = re.findall(r'\b[a-z][a-z0-9+#.]{1,20}\b', content)
+        words = _RE_SKILL_WORD.findall(content)
         unique_skills = len(set(words))
 
         if unique_skills >= 5:
@@ -333,13 +487,13 @@ class SectionEvaluator:
             score += 15
 
         # Check if organized (has categories)
-        if re.search(r'(technical|soft|tools|languages|frameworks)', content):
+        if _RE_SKILL_GROUPS.search(content):
             score += 15
         else:
             improvements.append("Consider organizing skills into categories (e.g., Technical, Tools, Soft Skills).")
 
         if job_desc:
-            job_words = set(job_desc.lower().split())
+            job_words = _job_words(job_desc)
             skill_words = set(words)
             overlap = len(job_words & skill_words)
             if overlap > 3:
@@ -361,29 +515,28 @@ class SectionEvaluator:
         score = 20
 
         # Check for bullet points / action verbs
-        bullet_count = len(re.findall(r'[•\-\*]', content))
+        bullet_count = content.count('•') + content.count('-') + content.count('*')
         if bullet_count >= 3:
             score += 20
         else:
             improvements.append("Use bullet points to list your responsibilities and achievements.")
 
         # Check for quantification (numbers, %)
-        if re.search(r'\d+%|\$[\d,]+|\d+\s*(users?|customers?|projects?|million|thousand)', content, re.IGNORECASE):
+        if _RE_QUANTIFIED.search(content):
             score += 25
         else:
             improvements.append("Quantify your achievements (e.g., 'Improved performance by 30%', 'Managed team of 5').")
 
-        # Check for action verbs
-        action_verbs = ['developed', 'built', 'led', 'managed', 'designed', 'implemented',
-                        'improved', 'created', 'delivered', 'achieved', 'increased', 'reduced']
-        verbs_found = sum(1 for v in action_verbs if v in content.lower())
+        # Check for action verbs (content lower-cased once, not once per verb)
+        content_lower = content.lower()
+        verbs_found = sum(1 for v in _ACTION_VERBS if v in content_lower)
         if verbs_found >= 3:
             score += 20
         else:
             improvements.append("Start bullet points with strong action verbs (e.g., Developed, Led, Implemented).")
 
         # Check for dates
-        if re.search(r'\b(20\d{2}|19\d{2}|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\b', content, re.IGNORECASE):
+        if _RE_EXP_DATE.search(content):
             score += 15
         else:
             improvements.append("Include dates for each position (month/year format).")
@@ -403,23 +556,22 @@ class SectionEvaluator:
         improvements = []
         score = 40
 
-        degree_terms = ['bachelor', 'master', 'phd', 'b.tech', 'm.tech', 'bsc', 'msc', 'b.e', 'm.e', 'degree', 'diploma']
-        if any(t in content for t in degree_terms):
+        if any(t in content for t in _DEGREE_TERMS):
             score += 25
         else:
             improvements.append("Clearly state your degree (e.g., B.Tech in Computer Science).")
 
-        if re.search(r'(university|college|institute|school)', content):
+        if _RE_INSTITUTION.search(content):
             score += 20
         else:
             improvements.append("Include your institution name.")
 
-        if re.search(r'(20\d{2}|19\d{2})', content):
+        if _RE_YEAR.search(content):
             score += 15
         else:
             improvements.append("Add your graduation year.")
 
-        if re.search(r'(cgpa|gpa|percentage|grade)', content):
+        if _RE_GRADE.search(content):
             score += 10
 
         return SectionScore(
@@ -438,18 +590,18 @@ class SectionEvaluator:
         score = 40
 
         # Count project entries (look for titles / separators)
-        project_count = len(re.findall(r'\n[A-Z]', content))
+        project_count = len(_RE_PROJECT_START.findall(content))
         if project_count >= 2:
             score += 20
         else:
             improvements.append("Include at least 2-3 projects.")
 
-        if re.search(r'(github|gitlab|demo|link|url|http)', content, re.IGNORECASE):
+        if _RE_PROJECT_LINK.search(content):
             score += 20
         else:
             improvements.append("Add GitHub links or demo URLs to your projects.")
 
-        if re.search(r'\b(built|developed|created|designed|implemented)\b', content, re.IGNORECASE):
+        if _RE_PROJECT_VERB.search(content):
             score += 20
         else:
             improvements.append("Describe what you built and the technologies used.")
@@ -466,7 +618,7 @@ class SectionEvaluator:
 
     def _score_certifications(self, section: Section, job_desc: str) -> SectionScore:
         content = section.content
-        cert_count = len(re.findall(r'\n', content)) + 1
+        cert_count = content.count('\n') + 1
         return SectionScore(
             section_name='Certifications',
             score=70,
@@ -500,3 +652,36 @@ class SectionEvaluator:
             feedback=f"{section.name.title()} section detected.",
             improvement_areas=[]
         )
+
+
+# ── Scorer dispatch ───────────────────────────────────────────────────────────
+
+# Built once, rather than a dict of bound methods on every _score_section call
+_SCORERS = {
+    'contact': SectionEvaluator._score_contact,
+    'summary': SectionEvaluator._score_summary,
+    'skills': SectionEvaluator._score_skills,
+    'experience': SectionEvaluator._score_experience,
+    'education': SectionEvaluator._score_education,
+    'projects': SectionEvaluator._score_projects,
+    'certifications': SectionEvaluator._score_certifications,
+    'achievements': SectionEvaluator._score_achievements,
+}
+
+
+# ── Per-JD / per-section caches ───────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=32)
+def _job_words(job_desc: str) -> FrozenSet[str]:
+    """Lower-cased JD word set, shared by the summary and skills scorers."""
+    return frozenset(job_desc.lower().split())
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_section_score(name: str, content: str, job_desc: str, full_text: str) -> SectionScore:
+    """Scoring is deterministic in these inputs (full_text feeds the contact
+    scorer and is '' for every other section), and the same sections are
+    re-scored across reruns and reports."""
+    evaluator = SectionEvaluator()
+    evaluator._full_resume_text = full_text
+    return evaluator._score_section(Section(name, content, 0, 0), job_desc)
@@ -366,7 +366,7 @@ def _build_preview_html(data: dict, dark: bool = False) -> str:
 # MAIN
 # ══════════════════════════════════════════════════════════════════════════════
 def render_cv_builder(gemini_key: str = ""):
-    from components.ai_suggester import AISuggester
+    from components.ai_suggester import get_suggester
     import os
     from dotenv import load_dotenv
     import pathlib
@@ -422,7 +422,7 @@ def render_cv_builder(gemini_key: str = ""):
         except Exception:
             pass
 
-    suggester = AISuggester(
+    suggester = get_suggester(
         api_key=_live_key or None,
         groq_key=_groq_key or None,
         aws_access_key=_aws_access or None,
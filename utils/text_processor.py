@@ -4,11 +4,11 @@ Shared text preprocessing functionality used across all components.
 """
 
 import re
-from typing import Set
+from typing import FrozenSet
 
 
 # Expanded stop words for professional context
-PROFESSIONAL_STOP_WORDS = {
+PROFESSIONAL_STOP_WORDS = frozenset({
     'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
     'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
     'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
@@ -32,7 +32,7 @@ PROFESSIONAL_STOP_WORDS = {
     'wait', 'serve', 'die', 'send', 'expect', 'build', 'stay', 'fall',
     'cut', 'reach', 'kill', 'remain', 'suggest', 'raise', 'pass', 'sell',
     'require', 'report', 'decide', 'pull', 'per', 'etc'
-}
+})
 
 
 class TextProcessor:
@@ -54,8 +54,8 @@ class TextProcessor:
         tokens = normalized.split()
         return [t for t in tokens if len(t) > 1 and t not in PROFESSIONAL_STOP_WORDS]
 
-    def get_stop_words(self) -> Set[str]:
-        """Return the stop word set."""
+    def get_stop_words(self) -> FrozenSet[str]:
+        """Return the shared (immutable) stop word set."""
         return PROFESSIONAL_STOP_WORDS
 
     def remove_formatting_artifacts(self, text: str) -> str: